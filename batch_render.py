@@ -0,0 +1,140 @@
+"""
+Render one AccelerometerFull video per IMU recording in a directory.
+
+Workers are long-lived processes that import manim and ``main.py`` once
+and build the static title, cube and graph panels once; every job after
+that only constructs and renders the recording-specific parts.
+
+    python batch_render.py recordings/ -o videos/ -j 4 --quality low
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from scene_loader import QUALITIES, load_scene_module
+
+
+# Set in each worker by _warm_worker
+_scene_class = None
+_warm_up_s = None
+
+
+def find_recordings(directory):
+    """CSV captures plus raw ``.f32`` logs that are not just a CSV's sidecar."""
+    directory = Path(directory)
+    csvs = sorted(directory.glob("*.csv"))
+    raw = [path for path in sorted(directory.glob("*.f32")) if not path.with_suffix(".csv").exists()]
+    return csvs + raw
+
+
+def _warm_worker():
+    global _scene_class, _warm_up_s
+    start = time.perf_counter()
+    main = load_scene_module(Path(__file__).with_name("main.py"))
+
+    # Builds the prototypes that static_elements() copies for every job
+    main.static_elements()
+    _scene_class = main.AccelerometerFull
+    _warm_up_s = time.perf_counter() - start
+
+
+def _render_recording(recording, output_dir, quality):
+    global _warm_up_s
+    from manim import tempconfig
+
+    recording = Path(recording)
+    media_dir = Path(output_dir) / ".media"
+    options = {
+        "quality": QUALITIES[quality],
+        # Partial movies are named by play number, so each job needs its own
+        # directory; the glyph/text cache stays shared between jobs
+        "media_dir": str(media_dir / recording.stem),
+        "text_dir": str(media_dir / "texts"),
+        "video_dir": str(output_dir),
+        "output_file": recording.stem,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "preview": False,
+    }
+    start = time.perf_counter()
+    with tempconfig(options):
+        scene = _scene_class(accel_log=str(recording))
+        scene.render()
+        frames = int(round(scene.renderer.time * scene.camera.frame_rate))
+    elapsed = time.perf_counter() - start
+
+    # Report the import/setup cost once, on the first job of each worker
+    warm_up, _warm_up_s = _warm_up_s, None
+    return {
+        "recording": recording.name,
+        "worker": os.getpid(),
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "warm_up_s": warm_up,
+    }
+
+
+def render_batch(recordings, output_dir, jobs=None, quality="low"):
+    """Render every recording; returns (results, failures)."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or min(len(recordings), os.cpu_count() or 1)
+    results, failures = [], []
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=jobs, mp_context=get_context("spawn"), initializer=_warm_worker,
+    ) as pool:
+        futures = {
+            pool.submit(_render_recording, str(path), str(output_dir), quality): path
+            for path in recordings
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                failures.append((path.name, error))
+                print(f"{path.name:<32} FAILED: {error}")
+                continue
+            results.append(result)
+            warm = f"  (+{result['warm_up_s']:.1f} s warm-up)" if result["warm_up_s"] else ""
+            print(
+                f"{result['recording']:<32} {result['frames']:5d} frames"
+                f"  {result['seconds']:6.1f} s  {result['fps']:6.1f} fps{warm}"
+            )
+
+    total = time.perf_counter() - start
+    frames = sum(result["frames"] for result in results)
+    print(
+        f"{len(results)}/{len(recordings)} videos in {total:.1f} s with {jobs} workers:"
+        f" {len(results) / total * 60 if total else 0.0:.1f} videos/min,"
+        f" {frames / total if total else 0.0:.1f} frames/s -> {output_dir}"
+    )
+    return results, failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recordings", type=Path, help="directory of .csv / .f32 captures")
+    parser.add_argument("-o", "--output", type=Path, default=Path("videos"))
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--quality", choices=QUALITIES, default="low")
+    args = parser.parse_args(argv)
+
+    recordings = find_recordings(args.recordings)
+    if not recordings:
+        print(f"No recordings in {args.recordings}")
+        return 1
+    _, failures = render_batch(recordings, args.output, args.jobs, args.quality)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Benchmark the demo scenes across quality presets.
+
+Each scene is rendered headlessly in a fresh process at every preset.
+The report gives frames/sec and peak RSS of a render with the profiler
+off. A second, profiled render gives the wall time per section for the
+scenes that attach the profiler; ``--no-sections`` skips it.
+
+    python benchmarks.py --save       # record a new baseline
+    python benchmarks.py --compare    # fail if slower/larger than the baseline
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+SCENES = [
+    ("main.py", "AccelerometerFull"),
+    ("clip1.py", "AccelerometerSample"),
+    ("example.py", "HelloWorld"),
+    ("example.py", "ShapesDemo"),
+]
+
+PRESETS = {"low": "l", "medium": "m", "high": "h"}
+# Instrumentation that would slow the timed render down
+INSTRUMENTATION_ENV = ("SCENE_PROFILE", "SCENE_LIFECYCLE")
+
+DEFAULT_BASELINE = Path(__file__).with_name("bench_baseline.json")
+
+
+def _count_frames(video_path):
+    import av
+
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        if stream.frames:
+            return stream.frames
+        return sum(1 for _ in container.decode(stream))
+
+
+def _section_times(profile_path):
+    if not profile_path.exists():
+        return {}
+    report = json.loads(profile_path.read_text())
+    sections = {}
+    for segment in report["segments"]:
+        sections[segment["section"]] = sections.get(segment["section"], 0.0) + segment["duration_s"]
+    return sections
+
+
+def _render(scene_file, scene_name, preset, work_dir, env):
+    """Render into ``work_dir`` and return (wall seconds, child rusage)."""
+    command = [
+        sys.executable, "-m", "manim", "render",
+        "-q", PRESETS[preset],
+        "--disable_caching",
+        "--progress_bar", "none",
+        "--media_dir", str(work_dir / "media"),
+        str(Path(__file__).with_name(scene_file)), scene_name,
+    ]
+    log_path = work_dir / "render.log"
+    with log_path.open("wb") as log:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 gives the rusage of this child alone
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"{scene_name} ({preset}) failed:\n{log_path.read_text(errors='replace')}")
+    return elapsed, usage
+
+
+def run_one(scene_file, scene_name, preset, sections=True):
+    """Render one scene at one preset and return its measurements."""
+    env = {name: value for name, value in os.environ.items() if name not in INSTRUMENTATION_ENV}
+    with tempfile.TemporaryDirectory(prefix="bench-") as work_dir:
+        work_dir = Path(work_dir)
+        elapsed, usage = _render(scene_file, scene_name, preset, work_dir, env)
+        videos = list((work_dir / "media").rglob(f"{scene_name}.mp4"))
+        frames = _count_frames(videos[0]) if videos else 0
+
+    sections_s = {}
+    if sections:
+        # Separate pass: the profiler's per-frame hooks must not count against fps or RSS
+        with tempfile.TemporaryDirectory(prefix="bench-profile-") as work_dir:
+            work_dir = Path(work_dir)
+            profiles = work_dir / "profiles"
+            _render(scene_file, scene_name, preset, work_dir, dict(env, SCENE_PROFILE=str(profiles)))
+            sections_s = _section_times(profiles / f"{scene_name}.profile.json")
+
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "peak_rss_mb": usage.ru_maxrss / 1024,  # KiB on Linux
+        "sections_s": sections_s,
+    }
+
+
+def run_suite(scenes, presets, sections=True):
+    results = {}
+    for scene_file, scene_name in scenes:
+        for preset in presets:
+            key = f"{scene_name}/{preset}"
+            result = run_one(scene_file, scene_name, preset, sections)
+            results[key] = result
+            print(
+                f"{key:<28} {result['frames']:5d} frames  {result['fps']:7.1f} fps"
+                f"  {result['peak_rss_mb']:7.1f} MB"
+            )
+            for section, seconds in result["sections_s"].items():
+                print(f"    {section:<22} {seconds:7.2f} s")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return a list of regressions beyond ``threshold`` (a fraction)."""
+    failures = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        if result["fps"] < reference["fps"] * (1 - threshold):
+            failures.append(f"{key}: {result['fps']:.1f} fps vs baseline {reference['fps']:.1f}")
+        if result["peak_rss_mb"] > reference["peak_rss_mb"] * (1 + threshold):
+            failures.append(
+                f"{key}: {result['peak_rss_mb']:.0f} MB vs baseline {reference['peak_rss_mb']:.0f}"
+            )
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scenes", default=",".join(name for _, name in SCENES))
+    parser.add_argument("--presets", default=",".join(PRESETS))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed regression (fraction)")
+    parser.add_argument("--no-sections", action="store_true", help="skip the profiled per-section pass")
+    args = parser.parse_args(argv)
+
+    wanted = args.scenes.split(",")
+    scenes = [(file, name) for file, name in SCENES if name in wanted]
+    results = run_suite(scenes, args.presets.split(","), sections=not args.no_sections)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"Baseline saved to {args.baseline}")
+    if args.compare:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save first")
+            return 1
+        failures = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+        for failure in failures:
+            print(f"FAIL {failure}")
+        print("PASS" if not failures else f"{len(failures)} regression(s)")
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
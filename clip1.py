@@ -1,14 +1,33 @@
+import os
+
 from manim import *
 import numpy as np
 
+from imu_log import IMULog
+from plotting import LODPyramid, coords_to_points, pixel_columns
+from primitives import DepthSortedCamera, MeshArrow, MeshCube
+from profiler import attach_profiler
+from text_cache import cached_text
+from traces import PartialPath
+
+
+# Exports 1080p60 unless a -q flag asks otherwise
 
-config.quality = "high_quality"  # ensure 1080p export
-config.frame_rate = 60
+# Optional real device capture (CSV or raw float32) replacing the synthetic noise
+ACCEL_LOG = os.environ.get("ACCEL_LOG")
 
 
 class AccelerometerSample(ThreeDScene):
 	"""Five-second teaser showing 3-axis accelerometer basics."""
 
+	def __init__(self, **kwargs):
+		# Depth-sorts all 3D faces in one vectorized pass
+		super().__init__(camera_class=DepthSortedCamera, **kwargs)
+
+	def setup(self):
+		# Per-updater/per-frame timings when SCENE_PROFILE is set
+		attach_profiler(self)
+
 	def construct(self):
 		# Camera and subtle background grid
 		self.set_camera_orientation(phi=60 * DEGREES, theta=-45 * DEGREES)
@@ -25,14 +44,14 @@ class AccelerometerSample(ThreeDScene):
 		grid.shift(DOWN * 0.5)
 		self.add(grid)
 
-		# IMU body (cube) with axis arrows
-		device = Cube(side_length=1.8, stroke_width=2.5).set_fill(BLUE_D, opacity=0.18)
+		# IMU body (cube) with axis arrows, low-poly; the axis arrows share one mesh
+		device = MeshCube(side_length=1.8, stroke_width=2.5).set_fill(BLUE_D, opacity=0.18)
 		device.shift(LEFT * 2.7 + UP * 0.4)
 
 		axis_len = 1.8
-		x_axis = Arrow3D(ORIGIN, RIGHT * axis_len, color=RED, thickness=0.025, base_radius=0.045)
-		y_axis = Arrow3D(ORIGIN, UP * axis_len, color=GREEN, thickness=0.025, base_radius=0.045)
-		z_axis = Arrow3D(ORIGIN, OUT * axis_len, color=BLUE, thickness=0.025, base_radius=0.045)
+		x_axis = MeshArrow(ORIGIN, RIGHT * axis_len, color=RED, thickness=0.025, base_radius=0.045)
+		y_axis = MeshArrow(ORIGIN, UP * axis_len, color=GREEN, thickness=0.025, base_radius=0.045)
+		z_axis = MeshArrow(ORIGIN, OUT * axis_len, color=BLUE, thickness=0.025, base_radius=0.045)
 		axes = VGroup(x_axis, y_axis, z_axis)
 		axes.move_to(device.get_center())
 
@@ -42,14 +61,14 @@ class AccelerometerSample(ThreeDScene):
 			("Y", GREEN, y_axis, UP),
 			("Z", BLUE, z_axis, OUT),
 		]:
-			label = Text(letter, color=color, font_size=26, weight=BOLD)
+			label = cached_text(letter, color=color, font_size=26, weight=BOLD)
 			label.add_background_rectangle(color="#050505", opacity=0.85, buff=0.04)
 			label.next_to(arrow.get_end(), direction, buff=0.25)
 			axis_labels.add(label)
 		self.add_fixed_orientation_mobjects(*axis_labels)
 
 		# Gravity vs motion arrows
-		gravity_arrow = Arrow3D(
+		gravity_arrow = MeshArrow(
 			start=device.get_center() + UP * 1.2,
 			end=device.get_center() + DOWN * 1.2,
 			color=BLUE_E,
@@ -76,6 +95,8 @@ class AccelerometerSample(ThreeDScene):
 		x_signal = 0.02 * rng.standard_normal(num_samples)
 		y_signal = 0.02 * rng.standard_normal(num_samples)
 		z_signal = -1.0 + 0.02 * rng.standard_normal(num_samples)
+		if ACCEL_LOG:
+			x_signal, y_signal, z_signal = IMULog(ACCEL_LOG).window(0, 5, num_samples)
 
 		signal_bank = [x_signal, y_signal, z_signal]
 
@@ -93,7 +114,7 @@ class AccelerometerSample(ThreeDScene):
 			)
 			axes_2d.shift(RIGHT * 3.2 + UP * y_pos)
 
-			title = Text(f"{name}-axis", color=color, font_size=22, weight=BOLD)
+			title = cached_text(f"{name}-axis", color=color, font_size=22, weight=BOLD)
 			title.next_to(axes_2d, UP, buff=0.1)
 
 			zero = DashedLine(axes_2d.c2p(0, 0), axes_2d.c2p(5, 0), color=GREY_C, stroke_opacity=0.4)
@@ -101,22 +122,26 @@ class AccelerometerSample(ThreeDScene):
 			graph_group = VGroup(axes_2d, title, zero)
 			graph_groups.append(graph_group)
 
-			points = [axes_2d.c2p(t, val) for t, val in zip(time_range, data)]
+			points = coords_to_points(axes_2d, time_range, data)
+			# At most ~2 corners per pixel column, keeping the noise peaks
+			pyramid = LODPyramid(data)
+			level = pyramid.pick_level(num_samples, pixel_columns(axes_2d))
 			full_line = VMobject(color=color, stroke_width=3)
-			full_line.set_points_as_corners(points)
+			full_line.set_points_as_corners(points[pyramid.levels[level]])
 
 			tracker = ValueTracker(0)
 			trackers.append(tracker)
 
-			partial_line = VMobject(color=color, stroke_width=3)
+			# Arc length of full_line is precomputed once; each frame is a binary search
+			partial_line = PartialPath(full_line, color=color, stroke_width=3)
 
-			def make_updater(ref_line, linked_tracker):
+			def make_updater(linked_tracker):
 				def updater(mob):
-					mob.pointwise_become_partial(ref_line, 0, linked_tracker.get_value())
+					mob.set_proportion(linked_tracker.get_value())
 
 				return updater
 
-			partial_line.add_updater(make_updater(full_line, tracker))
+			partial_line.add_updater(make_updater(tracker))
 			partial_lines.append(partial_line)
 
 		# On-screen labels (fixed to frame for clarity)
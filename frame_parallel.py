@@ -0,0 +1,218 @@
+"""
+Render the frames of one long play across several processes.
+
+    FRAME_PARALLEL=8 manim -qh main.py AccelerometerFull
+
+Only plays started through ``play_frame_parallel`` are split, and only
+when every updater they drive is a pure function of tracker values (no
+``dt`` integration), as with the demo progress plays. Each worker
+re-runs the scene with the earlier plays skipped, which rebuilds the
+exact state at the start of the play, jumps to the first time of its
+frame range and renders that range into a shared ``.npy`` memmap. The
+main process waits, then writes the frames to its movie in order and
+finishes the play as usual.
+"""
+
+import functools
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from scene_loader import load_scene_class
+
+
+PARALLEL_ENV = "FRAME_PARALLEL"
+SLICE_ENV = "FRAME_PARALLEL_SLICE"
+MIN_FRAMES_PER_JOB = 30  # below this a worker's scene rebuild costs more than it saves
+# Per-render instrumentation that must only run in the main process
+_MAIN_PROCESS_ONLY = ("SCENE_PROFILE", "SCENE_LIFECYCLE", "EXPORT_RESOLUTIONS", PARALLEL_ENV)
+
+
+def _render_slice(scene_file, scene_name, scene_kwargs, options, play_index, start, stop, frames_path):
+    from manim import tempconfig
+
+    for name in _MAIN_PROCESS_ONLY:
+        os.environ.pop(name, None)
+    os.environ[SLICE_ENV] = f"{play_index}:{start}:{stop}:{frames_path}"
+    scene_class = load_scene_class(scene_file, scene_name)
+    # Skipped plays still apply their end state, so play_index starts from the serial state
+    with tempconfig(dict(options, from_animation_number=play_index)):
+        scene_class(**scene_kwargs).render()
+    return stop - start
+
+
+class FrameParallel:
+    """Main-process side: splits marked plays into frame ranges for a process pool."""
+
+    def __init__(self, scene, jobs, scene_kwargs=None):
+        self.scene = scene
+        self.jobs = jobs
+        self.scene_kwargs = scene_kwargs or {}
+        self.marked = False
+        self.pool = None
+        self.frames_rendered = 0
+
+    def _options(self, media_dir):
+        from manim import config
+
+        return {
+            "pixel_width": config.pixel_width,
+            "pixel_height": config.pixel_height,
+            "frame_rate": config.frame_rate,
+            "media_dir": media_dir,
+            "disable_caching": True,
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+            "preview": False,
+        }
+
+    def render_frames(self, run_time):
+        """All frames of the current play, rendered by the pool, in order."""
+        from manim import config
+
+        scene = self.scene
+        num_frames = len(np.arange(0, run_time, 1 / config.frame_rate))
+        jobs = min(self.jobs, num_frames // MIN_FRAMES_PER_JOB)
+        if jobs < 2:
+            return None
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.jobs, mp_context=get_context("spawn"))
+
+        play_index = scene.renderer.num_plays
+        scene_file = sys.modules[type(scene).__module__].__file__
+        bounds = np.linspace(0, num_frames, jobs + 1).astype(int)
+        work_dir = tempfile.mkdtemp(prefix="frame-parallel-")
+        frames_path = str(Path(work_dir) / "frames.npy")
+        shape = (num_frames, config.pixel_height, config.pixel_width, 4)
+        np.lib.format.open_memmap(frames_path, mode="w+", dtype=np.uint8, shape=shape).flush()
+
+        futures = [
+            self.pool.submit(
+                _render_slice, scene_file, type(scene).__name__, self.scene_kwargs,
+                self._options(str(Path(work_dir) / "media")), play_index, int(start), int(stop), frames_path,
+            )
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+        self.frames_rendered += num_frames
+        return frames_path
+
+    def attach(self):
+        from tqdm import tqdm
+
+        scene = self.scene
+        get_time_progression = scene.get_time_progression
+
+        @functools.wraps(get_time_progression)
+        def parallel_time_progression(run_time, *args, **kwargs):
+            marked, self.marked = self.marked, False
+            if not marked or scene.renderer.skip_animations:
+                return get_time_progression(run_time, *args, **kwargs)
+            frames_path = self.render_frames(run_time)
+            if frames_path is None:
+                return get_time_progression(run_time, *args, **kwargs)
+            frames = np.load(frames_path, mmap_mode="r")
+            for frame in frames:
+                scene.renderer.add_frame(np.array(frame))
+            del frames
+            shutil.rmtree(Path(frames_path).parent, ignore_errors=True)
+            # Nothing left to render here: the play only applies its end state
+            return tqdm([], disable=True)
+
+        scene.get_time_progression = parallel_time_progression
+
+        tear_down = scene.tear_down
+
+        @functools.wraps(tear_down)
+        def tear_down_and_shutdown(*args, **kwargs):
+            if self.pool is not None:
+                self.pool.shutdown()
+                print(f"Frame-parallel: {self.frames_rendered} frames rendered by {self.jobs} workers")
+            return tear_down(*args, **kwargs)
+
+        scene.tear_down = tear_down_and_shutdown
+        return self
+
+
+class FrameSlice:
+    """Worker side: renders frames [start, stop) of play ``play_index``, then ends the scene."""
+
+    def __init__(self, scene, spec):
+        play_index, start, stop, frames_path = spec.split(":", 3)
+        self.scene = scene
+        self.play_index = int(play_index)
+        self.start = int(start)
+        self.stop = int(stop)
+        self.frames = np.load(frames_path, mmap_mode="r+")
+        self.next_frame = self.start
+
+    def attach(self):
+        from manim import config
+        from manim.utils.exceptions import EndSceneEarlyException
+        from tqdm import tqdm
+
+        scene = self.scene
+        renderer = scene.renderer
+        get_time_progression = scene.get_time_progression
+
+        @functools.wraps(get_time_progression)
+        def slice_time_progression(run_time, *args, **kwargs):
+            if renderer.num_plays != self.play_index or renderer.skip_animations:
+                return get_time_progression(run_time, *args, **kwargs)
+            times = np.arange(0, run_time, 1 / config.frame_rate)
+            return tqdm(times[self.start : self.stop], disable=True)
+
+        def capture_slice(frame, num_frames=1):
+            for _ in range(num_frames):
+                self.frames[self.next_frame] = frame
+                self.next_frame += 1
+            if self.next_frame >= self.stop:
+                self.frames.flush()
+                raise EndSceneEarlyException()
+
+        original_play = renderer.play
+
+        @functools.wraps(original_play)
+        def play(*args, **kwargs):
+            # Frames of the target play go to the memmap instead of the movie
+            renderer.add_frame = capture_slice if renderer.num_plays == self.play_index else add_frame
+            return original_play(*args, **kwargs)
+
+        add_frame = renderer.add_frame
+        scene.get_time_progression = slice_time_progression
+        renderer.play = play
+        return self
+
+
+def play_frame_parallel(scene, *args, **kwargs):
+    """``scene.play`` that may be split across processes; updaters must not depend on ``dt``."""
+    parallel = getattr(scene, "frame_parallel", None)
+    if isinstance(parallel, FrameParallel):
+        parallel.marked = True
+    return scene.play(*args, **kwargs)
+
+
+def attach_frame_parallel(scene, **scene_kwargs):
+    """
+    Split marked plays over FRAME_PARALLEL processes; otherwise a no-op.
+
+    ``scene_kwargs`` are what workers pass to the scene class to rebuild it.
+    """
+    spec = os.environ.get(SLICE_ENV)
+    if spec:
+        scene.frame_parallel = FrameSlice(scene, spec).attach()
+        return scene.frame_parallel
+    jobs = int(os.environ.get(PARALLEL_ENV) or 0)
+    if jobs < 2:
+        return None
+    scene.frame_parallel = FrameParallel(scene, jobs, scene_kwargs).attach()
+    return scene.frame_parallel
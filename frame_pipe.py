@@ -0,0 +1,224 @@
+"""
+Stream rendered frames straight into an ffmpeg process from a fixed buffer pool.
+
+    FRAME_PIPE=4 manim -qh main.py AccelerometerFull
+
+Replaces manim's per-frame ``pixel_array.copy()`` and unbounded writer
+queue for the full-resolution movie. Each rendered frame is copied once
+from the Cairo surface into one of ``FRAME_PIPE`` preallocated buffers.
+Static images and frozen ``wait`` frames keep manim's own copies, since
+the renderer holds on to them. The buffer goes through
+a queue bounded by the pool size to an encoder thread, which writes it to
+ffmpeg's stdin without an intermediate ``bytes`` copy. The buffer then
+returns to the pool. Memory stays at the pool size whatever the encoder
+speed, and a render that outruns the encoder blocks on the pool.
+Rendering and encoding overlap, so throughput is that of the slower
+stage. Stall time on each side is printed when the movie is closed.
+
+The movie goes to manim's usual output path. Partial movies, sections
+and the play cache are bypassed, since every frame goes through the pipe.
+"""
+
+import functools
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+
+import numpy as np
+from manim import config
+
+
+PIPE_ENV = "FRAME_PIPE"
+
+
+class FramePool:
+    """Fixed set of frame buffers handed out and returned in any order."""
+
+    def __init__(self, shape, size):
+        self.buffers = [np.empty(shape, dtype=np.uint8) for _ in range(size)]
+        self.ids = set(map(id, self.buffers))
+        self.free = queue.Queue()
+        for buffer in self.buffers:
+            self.free.put(buffer)
+        self.wait_s = 0.0  # time callers spent waiting for a free buffer
+
+    def acquire(self):
+        start = time.perf_counter()
+        buffer = self.free.get()
+        self.wait_s += time.perf_counter() - start
+        return buffer
+
+    def release(self, buffer):
+        self.free.put(buffer)
+
+    def owns(self, array):
+        return id(array) in self.ids
+
+    @property
+    def nbytes(self):
+        return sum(buffer.nbytes for buffer in self.buffers)
+
+
+class FramePipe:
+    def __init__(self, path, width, height, frame_rate, pool_size=4):
+        ffmpeg = shutil.which("ffmpeg")
+        if ffmpeg is None:
+            raise RuntimeError(f"{PIPE_ENV} needs an ffmpeg executable on PATH")
+        self.path = path
+        self.pool = FramePool((height, width, 4), pool_size)
+        # Bounded by the pool: a frame is either free, queued, or being written
+        self.queue = queue.Queue(maxsize=pool_size)
+        self.process = subprocess.Popen(
+            [
+                ffmpeg, "-y", "-loglevel", "error",
+                "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", f"{frame_rate:g}",
+                "-i", "-",
+                "-an", "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", "18", "-movflags", "+faststart",
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+            bufsize=0,  # raw pipe: each frame goes from its buffer straight into the write
+        )
+        self.frames = 0
+        self.put_wait_s = 0.0  # render side: queue full
+        self.idle_s = 0.0  # encoder side: queue empty
+        self.write_s = 0.0
+        self.error = None
+        self.started = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name="frame-pipe", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        stdin = self.process.stdin
+        try:
+            while True:
+                start = time.perf_counter()
+                item = self.queue.get()
+                self.idle_s += time.perf_counter() - start
+                if item is None:
+                    break
+                buffer, count = item
+                start = time.perf_counter()
+                try:
+                    if self.error is None:
+                        view = memoryview(buffer).cast("B")
+                        for _ in range(count):
+                            stdin.write(view)
+                        self.frames += count
+                except (BrokenPipeError, OSError) as error:  # re-raised on the render thread by close()
+                    self.error = error
+                finally:
+                    self.pool.release(buffer)
+                self.write_s += time.perf_counter() - start
+        finally:
+            stdin.close()
+
+    # === RENDER SIDE ===
+
+    def frame_from(self, pixels):
+        """Copy ``pixels`` into a pool buffer (waits while all are in flight)."""
+        buffer = self.pool.acquire()
+        np.copyto(buffer, pixels)
+        return buffer
+
+    def put(self, frame, count=1):
+        if not self.pool.owns(frame):
+            frame = self.frame_from(frame)
+        start = time.perf_counter()
+        self.queue.put((frame, count))
+        self.put_wait_s += time.perf_counter() - start
+
+    def discard(self, frame):
+        if self.pool.owns(frame):
+            self.pool.release(frame)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        returncode = self.process.wait()
+        if self.error is not None:
+            raise self.error
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {returncode} writing {self.path}")
+        self.report()
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        print(f"Frame pipe: {self.frames} frames to {self.path} in {elapsed:.1f} s ({self.frames / elapsed:.1f} fps)")
+        print(
+            f"  render stalls: {self.pool.wait_s + self.put_wait_s:.2f} s waiting on the encoder, "
+            f"encoder idle: {self.idle_s:.2f} s waiting on the renderer, "
+            f"pipe writes: {self.write_s:.2f} s, pool: {self.pool.nbytes / 1e6:.1f} MB"
+        )
+
+    # === WIRING ===
+
+    def attach(self, scene):
+        renderer = scene.renderer
+        get_frame = renderer.get_frame
+        render = renderer.render
+        rendering = False
+
+        @functools.wraps(get_frame)
+        def get_pooled_frame():
+            # Only render() passes its frame straight on to add_frame, which
+            # hands the buffer back; everywhere else the renderer keeps it
+            if rendering:
+                return self.frame_from(renderer.camera.pixel_array)
+            return get_frame()
+
+        @functools.wraps(render)
+        def render_pooled(*args, **kwargs):
+            nonlocal rendering
+            rendering = True
+            try:
+                return render(*args, **kwargs)
+            finally:
+                rendering = False
+
+        renderer.get_frame = get_pooled_frame
+        renderer.render = render_pooled
+
+        add_frame = renderer.add_frame
+
+        @functools.wraps(add_frame)
+        def add_frame_to_pipe(frame, num_frames=1):
+            # Still advances renderer.time; the movie writer itself is switched off
+            add_frame(frame, num_frames)
+            if renderer.skip_animations:
+                self.discard(frame)
+            else:
+                self.put(frame, num_frames)
+
+        renderer.add_frame = add_frame_to_pipe
+
+        file_writer = renderer.file_writer
+        finish = file_writer.finish
+
+        @functools.wraps(finish)
+        def finish_after_pipe(*args, **kwargs):
+            self.close()
+            return finish(*args, **kwargs)
+
+        file_writer.finish = finish_after_pipe
+        return self
+
+
+def attach_frame_pipe(scene):
+    """Write the movie through a FRAME_PIPE-buffer pipe to ffmpeg; otherwise a no-op."""
+    pool_size = int(os.environ.get(PIPE_ENV) or 0)
+    if pool_size <= 0 or not config.write_to_movie:
+        return None
+    if os.environ.get("EXPORT_RESOLUTIONS"):
+        # Export encoders would hold on to pool buffers after they are recycled
+        raise ValueError(f"{PIPE_ENV} and EXPORT_RESOLUTIONS cannot be combined; use one of them")
+    if config.save_sections:
+        raise ValueError(f"{PIPE_ENV} writes one movie and cannot save per-section videos")
+    path = scene.renderer.file_writer.movie_file_path
+    # The pipe writes the movie; manim's writer and play cache stay out of the way
+    config.disable_caching = True
+    config.write_to_movie = False
+    return FramePipe(path, config.pixel_width, config.pixel_height, config.frame_rate, pool_size).attach(scene)
@@ -0,0 +1,126 @@
+import itertools as it
+import zlib
+
+from manim.utils.family import extract_mobject_family_members
+import numpy as np
+
+from primitives import DepthSortedCamera
+
+
+def _crc(array, crc):
+    return zlib.crc32(np.ascontiguousarray(array), crc)
+
+
+class FrozenLayer:
+    """
+    One cached raster of a set of static fixed-in-frame mobjects.
+
+    ``fingerprint`` summarizes the points and colors of the whole family;
+    a change to any of them invalidates the raster. The raster is only
+    (re)built once the fingerprint has held for two consecutive frames, so
+    fades and other animations of the frozen mobjects fall back to regular
+    inline drawing instead of re-rasterizing twice per frame.
+    """
+
+    def __init__(self, mobjects):
+        self.mobjects = list(mobjects)
+        self.buffer = None
+        self.bounds = None  # (top, bottom, left, right) of the non-empty pixels
+        self.raster_fingerprint = None
+        self.last_fingerprint = None
+
+    def get_members(self):
+        return extract_mobject_family_members(self.mobjects, only_those_with_points=True)
+
+    def fingerprint(self, members, camera):
+        crc = _crc(np.asarray(camera.frame_center, dtype=float), 0)
+        for mob in members:
+            crc = zlib.crc32(id(mob).to_bytes(8, "little"), crc)
+            crc = _crc(mob.points, crc)
+            for attr in ("stroke_rgbas", "fill_rgbas", "background_stroke_rgbas"):
+                rgbas = getattr(mob, attr, None)
+                if rgbas is not None:
+                    crc = _crc(rgbas, crc)
+            widths = (getattr(mob, "stroke_width", 0), getattr(mob, "background_stroke_width", 0))
+            crc = _crc(np.array(widths, dtype=float), crc)
+        return crc
+
+
+class FrozenLayerCamera(DepthSortedCamera):
+    """
+    3D camera that rasterizes frozen fixed-in-frame mobjects once.
+
+    While a frozen group is unchanged and fully on screen it is composited
+    from its cached pixel buffer, under the rest of the frame, instead of
+    being redrawn through Cairo every frame.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frozen_layers = []
+
+    def freeze(self, *mobjects):
+        missing = [mob for mob in mobjects if mob not in self.fixed_in_frame_mobjects]
+        if missing:
+            raise ValueError("only fixed-in-frame mobjects can be frozen")
+        layer = FrozenLayer(mobjects)
+        self.frozen_layers.append(layer)
+        return layer
+
+    def unfreeze(self, layer):
+        self.frozen_layers.remove(layer)
+
+    def _rasterize(self, layer, members):
+        if layer.buffer is None or layer.buffer.shape != self.pixel_array.shape:
+            # One buffer per layer for its whole life, so the cached Cairo
+            # context keyed on id(buffer) never outlives its memory
+            layer.buffer = np.zeros_like(self.pixel_array)
+        layer.buffer[...] = 0
+        for group_type, group in it.groupby(members, self.type_or_raise):
+            self.display_funcs[group_type](list(group), layer.buffer)
+        alpha = layer.buffer[:, :, 3]
+        rows = np.flatnonzero(alpha.any(axis=1))
+        cols = np.flatnonzero(alpha.any(axis=0))
+        if len(rows) == 0:
+            layer.bounds = None
+        else:
+            layer.bounds = (rows[0], rows[-1] + 1, cols[0], cols[-1] + 1)
+
+    def _composite(self, layer):
+        if layer.bounds is None:
+            return
+        top, bottom, left, right = layer.bounds
+        src = layer.buffer[top:bottom, left:right].astype(np.uint16)
+        dst = self.pixel_array[top:bottom, left:right]
+        # Premultiplied "over": dst = src + dst * (1 - src_alpha)
+        inverse_alpha = 255 - src[:, :, 3:4]
+        dst[...] = src + (dst * inverse_alpha + 127) // 255
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if not self.frozen_layers:
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        self.reset_rotation_matrix()
+        to_display = self.get_mobjects_to_display(mobjects, **kwargs)
+        displayed = set(to_display)
+        skipped = set()
+        for layer in self.frozen_layers:
+            members = layer.get_members()
+            if not members or not all(mob in displayed for mob in members):
+                # Frozen mobjects not (fully) in this capture are drawn inline
+                continue
+            fingerprint = layer.fingerprint(members, self)
+            stable = fingerprint == layer.last_fingerprint
+            layer.last_fingerprint = fingerprint
+            if not stable:
+                continue
+            if layer.raster_fingerprint != fingerprint:
+                self._rasterize(layer, members)
+                layer.raster_fingerprint = fingerprint
+            self._composite(layer)
+            skipped.update(members)
+
+        if skipped:
+            to_display = [mob for mob in to_display if mob not in skipped]
+        for group_type, group in it.groupby(to_display, self.type_or_raise):
+            self.display_funcs[group_type](list(group), self.pixel_array)
@@ -0,0 +1,201 @@
+"""
+Golden-frame check for the demo scenes, with per-scene frame-time budgets.
+
+    python golden_frames.py                      # check every scene
+    python golden_frames.py AccelerometerFull    # check one
+    python golden_frames.py --update             # re-bless the goldens after an intended change
+
+Each scene is rendered at low quality without writing a movie. The frames
+covering the timestamps in ``SCENES`` are compared with
+``golden/<Scene>/t<seconds>.png`` after a small blur, so antialiasing
+jitter passes and real changes do not. A frame fails when more than
+``--tolerance`` of its pixels differ by more than ``--threshold`` in
+luma. Failing frames and their diff maps are written to ``golden_out/``.
+
+The same render also times every frame, from the end of one frame to
+the end of the next within a play. The scene fails if its p50 or p95
+exceeds the budget in ``golden/budgets.json``. ``--update`` records a
+missing budget at 1.5x the measured time. Budgets are machine-specific;
+``--no-budgets`` skips them.
+
+``golden/`` is committed with the scenes. A checkout without goldens for
+a requested scene exits with status 2 before rendering anything; it does
+not report a pass. Run ``--update`` on the reference machine and commit
+``golden/`` to bootstrap it.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from scene_loader import load_scene_class
+
+
+HERE = Path(__file__).parent
+GOLDEN_DIR = HERE / "golden"
+OUT_DIR = HERE / "golden_out"
+BUDGETS_FILE = GOLDEN_DIR / "budgets.json"
+BUDGET_SLACK = 1.5  # recorded budget = measured time x this
+
+# Scene -> (file, timestamps in seconds); roughly one frame per section
+SCENES = {
+    "AccelerometerFull": ("main.py", [3.0, 9.0, 15.0, 21.5, 27.0, 31.5]),
+    "AccelerometerSample": ("clip1.py", [1.0, 2.5, 4.5]),
+    "ShapesDemo": ("example.py", [1.5, 3.0, 4.5, 6.0]),
+}
+
+
+# === RENDERING ===
+
+def render_frames(scene_name, timestamps):
+    """Frames at ``timestamps`` (seconds) plus the per-frame render times."""
+    from manim import tempconfig
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    scene_file, _ = SCENES[scene_name]
+    scene_class = load_scene_class(HERE / scene_file, scene_name)
+    options = {
+        "quality": "low_quality",
+        "media_dir": str(OUT_DIR / ".media"),
+        "write_to_movie": False,
+        "disable_caching": True,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "preview": False,
+    }
+    pending = sorted(timestamps)
+    frames = {}
+    frame_times = []
+
+    with tempconfig(options):
+        scene = scene_class()
+        renderer = scene.renderer
+        add_frame = renderer.add_frame
+        last = None  # (end of previous frame, play it belonged to)
+
+        def add_and_capture(frame, num_frames=1):
+            nonlocal last
+            now = time.perf_counter()
+            if last is not None and last[1] == renderer.num_plays and num_frames == 1:
+                frame_times.append(now - last[0])
+            add_frame(frame, num_frames)
+            # This frame is on screen until renderer.time
+            while pending and pending[0] < renderer.time - 1e-9:
+                frames[pending.pop(0)] = np.array(frame)
+            if not pending:
+                raise EndSceneEarlyException()
+            last = (time.perf_counter(), renderer.num_plays)
+
+        renderer.add_frame = add_and_capture
+        scene.render()
+    return frames, np.asarray(frame_times)
+
+
+# === COMPARISON ===
+
+def _blurred_luma(pixels):
+    luma = pixels[..., :3].astype(np.float32) @ np.array([0.299, 0.587, 0.114], dtype=np.float32) / 255
+    height, width = luma.shape
+    padded = np.pad(luma, 1, mode="edge")
+    return sum(padded[dy : dy + height, dx : dx + width] for dy in range(3) for dx in range(3)) / 9
+
+
+def compare(golden, actual, threshold):
+    """(fraction of differing pixels, per-pixel luma difference)."""
+    if golden.shape != actual.shape:
+        return 1.0, None
+    difference = np.abs(_blurred_luma(golden) - _blurred_luma(actual))
+    return float(np.mean(difference > threshold)), difference
+
+
+def _frame_name(timestamp):
+    return f"t{timestamp:06.2f}.png"
+
+
+def check_scene(scene_name, args, budgets):
+    from PIL import Image
+
+    _, timestamps = SCENES[scene_name]
+    frames, frame_times = render_frames(scene_name, timestamps)
+    failures = []
+
+    golden_dir = GOLDEN_DIR / scene_name
+    out_dir = OUT_DIR / scene_name
+    for timestamp in timestamps:
+        name = _frame_name(timestamp)
+        if timestamp not in frames:
+            failures.append(f"{name}: scene ended before {timestamp:g} s")
+            continue
+        actual = frames[timestamp]
+        golden_path = golden_dir / name
+        if args.update:
+            golden_dir.mkdir(parents=True, exist_ok=True)
+            Image.fromarray(actual).save(golden_path)
+            continue
+        if not golden_path.exists():
+            failures.append(f"{name}: no golden (run with --update)")
+            continue
+        fraction, difference = compare(np.asarray(Image.open(golden_path).convert("RGBA")), actual, args.threshold)
+        if fraction <= args.tolerance:
+            continue
+        out_dir.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(actual).save(out_dir / name)
+        if difference is None:
+            failures.append(f"{name}: size changed")
+            continue
+        diff_image = (np.clip(difference / args.threshold, 0, 1) * 255).astype(np.uint8)
+        Image.fromarray(diff_image).save(out_dir / name.replace(".png", ".diff.png"))
+        failures.append(f"{name}: {fraction:.2%} of pixels differ (tolerance {args.tolerance:.2%})")
+
+    p50 = float(np.percentile(frame_times, 50) * 1000) if len(frame_times) else 0.0
+    p95 = float(np.percentile(frame_times, 95) * 1000) if len(frame_times) else 0.0
+    print(f"{scene_name}: {len(frames)}/{len(timestamps)} frames, {len(frame_times)} timed, p50 {p50:.1f} ms, p95 {p95:.1f} ms")
+    if not args.no_budgets:
+        budget = budgets.get(scene_name)
+        if budget is None and args.update:
+            budgets[scene_name] = {"p50_ms": round(p50 * BUDGET_SLACK, 1), "p95_ms": round(p95 * BUDGET_SLACK, 1)}
+        elif budget is None:
+            failures.append("no frame-time budget (run with --update)")
+        else:
+            for key, measured in (("p50_ms", p50), ("p95_ms", p95)):
+                if measured > budget[key]:
+                    failures.append(f"{key.split('_')[0]} frame time {measured:.1f} ms over budget {budget[key]:.1f} ms")
+
+    for failure in failures:
+        print(f"  FAIL {failure}")
+    return not failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scenes", nargs="*", metavar="scene", help=f"scenes to check (default: all of {', '.join(SCENES)})")
+    parser.add_argument("--update", action="store_true", help="write the rendered frames as the new goldens")
+    parser.add_argument("--tolerance", type=float, default=0.002, help="max fraction of differing pixels")
+    parser.add_argument("--threshold", type=float, default=0.05, help="luma difference (0-1) that counts as differing")
+    parser.add_argument("--no-budgets", action="store_true", help="skip the frame-time budgets")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenes if name not in SCENES]
+    if unknown:
+        parser.error(f"unknown scene(s) {', '.join(unknown)}")
+
+    scenes = args.scenes or list(SCENES)
+    unblessed = [name for name in scenes if not any((GOLDEN_DIR / name).glob("*.png"))]
+    if unblessed and not args.update:
+        print(f"No goldens committed for {', '.join(unblessed)} in {GOLDEN_DIR}")
+        print("Render them on the reference machine with --update and commit golden/")
+        return 2
+
+    budgets = json.loads(BUDGETS_FILE.read_text()) if BUDGETS_FILE.exists() else {}
+    results = [check_scene(name, args, budgets) for name in scenes]
+    if args.update and not args.no_budgets:
+        GOLDEN_DIR.mkdir(parents=True, exist_ok=True)
+        BUDGETS_FILE.write_text(json.dumps(budgets, indent=1) + "\n")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
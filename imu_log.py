@@ -0,0 +1,234 @@
+import contextlib
+import csv
+import os
+
+import numpy as np
+
+
+DEFAULT_COLUMNS = ("t", "x", "y", "z")
+
+
+def _times_path(bin_path):
+    return os.path.splitext(bin_path)[0] + ".t.f64"
+
+
+def _convert_csv(csv_path, bin_path, columns, chunk_rows=65536):
+    """
+    Stream a CSV capture into a raw float32 sidecar, one chunk at a time.
+
+    float32 keeps ~7 significant digits, too few for epoch or long
+    microsecond timestamps, so a ``"t"`` column is also written at full
+    precision to a float64 ``.t.f64`` sidecar.
+    """
+    t_index = columns.index("t") if "t" in columns else None
+    times_path = _times_path(bin_path)
+    try:
+        with contextlib.ExitStack() as files:
+            src = files.enter_context(open(csv_path, newline=""))
+            dst = files.enter_context(open(bin_path + ".tmp", "wb"))
+            if t_index is not None:
+                times_dst = files.enter_context(open(times_path + ".tmp", "wb"))
+            reader = csv.reader(src)
+            first = next(reader, None)
+            if first is None:
+                raise ValueError(f"{csv_path} is empty")
+            try:
+                [float(v) for v in first]
+            except ValueError:
+                # Header row: pick the requested columns by name
+                header = [name.strip().lower() for name in first]
+                missing = [name for name in columns if name not in header]
+                if missing:
+                    raise ValueError(f"{csv_path} has no column(s) {missing}")
+                order = [header.index(name) for name in columns]
+                pending = []
+            else:
+                order = list(range(len(columns)))
+                pending = [first]
+
+            def parse(row):
+                try:
+                    return [float(row[i]) for i in order]
+                except (IndexError, ValueError):
+                    raise ValueError(
+                        f"{csv_path}:{reader.line_num}: expected {max(order) + 1} numeric columns, got {row!r}"
+                    ) from None
+
+            def flush(rows):
+                rows = np.asarray(rows, dtype=float)
+                rows.astype("<f4").tofile(dst)
+                if t_index is not None:
+                    rows[:, t_index].astype("<f8").tofile(times_dst)
+
+            rows = [parse(row) for row in pending]
+            for row in reader:
+                if not row:
+                    continue
+                rows.append(parse(row))
+                if len(rows) >= chunk_rows:
+                    flush(rows)
+                    rows = []
+            if rows:
+                flush(rows)
+    except BaseException:
+        # Leave no half-written sidecars behind
+        for path in (bin_path + ".tmp", times_path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+    if t_index is not None:
+        os.replace(times_path + ".tmp", times_path)
+    os.replace(bin_path + ".tmp", bin_path)
+
+
+def _searchsorted(column, values):
+    """
+    Vectorized binary search over a strided memmap column.
+
+    ``np.searchsorted`` makes its haystack contiguous first, which would
+    pull the whole column into memory; this only touches ~log2(N) rows per
+    query value.
+    """
+    lo = np.zeros(len(values), dtype=np.intp)
+    hi = np.full(len(values), len(column), dtype=np.intp)
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) // 2
+        probe = np.where(active, mid, 0)
+        below = column[probe] < values
+        lo = np.where(active & below, mid + 1, lo)
+        hi = np.where(active & ~below, mid, hi)
+
+
+def synthetic_samples(start, end, sample_rate=100):
+    """
+    Stand-in session when no device log is available: slow drifting bursts
+    on X/Y and gravity on Z. Returns ``(times, [x, y, z])`` for
+    ``start <= t < end``, sampled at ``sample_rate``.
+    """
+    t = np.arange(np.ceil(start * sample_rate), np.ceil(end * sample_rate)) / sample_rate
+    noise = 0.03 * np.sin(37.0 * t) * np.sin(11.0 * t)
+    return t, [
+        1.2 * np.sin(2 * np.pi * 0.3 * t) * np.sin(2 * np.pi * 0.05 * t) + noise,
+        0.6 * np.sin(2 * np.pi * 0.17 * t) + noise,
+        -1.0 + 0.3 * np.sin(2 * np.pi * 0.11 * t) + noise,
+    ]
+
+
+class IMULog:
+    """
+    Memory-mapped accelerometer capture.
+
+    Raw binary logs are little-endian float32 rows with one value per entry
+    in ``columns``. CSV logs are converted once into a ``.f32`` sidecar of
+    that layout and mapped from there; their times are read from the
+    float64 ``.t.f64`` sidecar instead of the float32 column. Without a
+    ``"t"`` column the sample times come from ``sample_rate``.
+
+    Nothing here reads the whole file: lookups binary-search the mapped
+    time column and fancy-index only the rows they hit.
+    """
+
+    def __init__(self, path, columns=DEFAULT_COLUMNS, sample_rate=None):
+        self.path = os.fspath(path)
+        self.columns = tuple(columns)
+        if "t" not in self.columns and sample_rate is None:
+            raise ValueError("logs without a 't' column need a sample_rate")
+        self.sample_rate = sample_rate
+
+        bin_path = self.path
+        times_path = None
+        if self.path.lower().endswith(".csv"):
+            bin_path = os.path.splitext(self.path)[0] + ".f32"
+            times_path = _times_path(bin_path) if "t" in self.columns else None
+            stale = any(
+                not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(self.path)
+                for path in (bin_path, times_path) if path is not None
+            )
+            if stale:
+                _convert_csv(self.path, bin_path, self.columns)
+
+        row_bytes = 4 * len(self.columns)
+        num_rows = os.path.getsize(bin_path) // row_bytes
+        if num_rows < 2:
+            raise ValueError(f"{self.path} holds fewer than two samples")
+        self.data = np.memmap(bin_path, dtype="<f4", mode="r", shape=(num_rows, len(self.columns)))
+        # Sample times: full precision for converted CSVs, the float32 column for raw logs
+        self.times = None
+        if "t" in self.columns:
+            if times_path is not None:
+                self.times = np.memmap(times_path, dtype="<f8", mode="r", shape=(num_rows,))
+            else:
+                self.times = self.channel("t")
+
+    def __len__(self):
+        return len(self.data)
+
+    def channel(self, name):
+        """Strided view of one column, still backed by the file."""
+        return self.data[:, self.columns.index(name)]
+
+    @property
+    def start_time(self):
+        return float(self.times[0]) if self.times is not None else 0.0
+
+    @property
+    def duration(self):
+        if self.times is not None:
+            return float(self.times[-1]) - self.start_time
+        return (len(self) - 1) / self.sample_rate
+
+    def _locate(self, times):
+        # Fractional row index for each requested time
+        times = np.asarray(times, dtype=float)
+        if self.times is None:
+            return np.clip(times * self.sample_rate, 0, len(self) - 1)
+        t_col = self.times
+        times = times + self.start_time
+        right = np.clip(_searchsorted(t_col, times), 1, len(self) - 1)
+        t0 = t_col[right - 1].astype(float)
+        t1 = t_col[right].astype(float)
+        span = np.where(t1 > t0, t1 - t0, 1.0)
+        return right - 1 + np.clip((times - t0) / span, 0, 1)
+
+    def resample(self, times, channels=("x", "y", "z")):
+        """
+        Linearly interpolate ``channels`` at ``times`` (seconds from the
+        start of the log). Returns one float64 array per channel.
+        """
+        position = self._locate(times)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, len(self) - 1)
+        alpha = position - lower
+        rows_lo = self.data[lower].astype(float)
+        rows_hi = self.data[upper].astype(float)
+        rows = rows_lo + (rows_hi - rows_lo) * alpha[:, None]
+        return [rows[:, self.columns.index(name)] for name in channels]
+
+    def window(self, start, duration, num_samples, channels=("x", "y", "z")):
+        """Decimate ``[start, start + duration]`` to ``num_samples`` evenly spaced samples."""
+        times = np.linspace(start, start + duration, num_samples)
+        return self.resample(times, channels)
+
+    def frames(self, frame_rate, start=0.0, duration=None, channels=("x", "y", "z")):
+        """Samples aligned to a video frame timeline."""
+        if duration is None:
+            duration = self.duration - start
+        num_frames = int(round(duration * frame_rate)) + 1
+        return self.window(start, duration, num_frames, channels)
+
+    def rows_between(self, start, end, channels=("x", "y", "z")):
+        """Raw samples with ``start <= t < end``; returns ``(times, [channel arrays])``."""
+        if self.times is not None:
+            bounds = _searchsorted(self.times, np.array([start, end]) + self.start_time)
+        else:
+            bounds = np.ceil(np.array([start, end]) * self.sample_rate).astype(np.intp)
+        lo, hi = np.clip(bounds, 0, len(self))
+        rows = np.asarray(self.data[lo:hi], dtype=float)
+        if self.times is not None:
+            times = np.asarray(self.times[lo:hi]) - self.start_time
+        else:
+            times = np.arange(lo, hi) / self.sample_rate
+        return times, [rows[:, self.columns.index(name)] for name in channels]
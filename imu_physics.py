@@ -0,0 +1,137 @@
+"""
+Batched accelerometer model for the demo sections.
+
+Given a position trajectory and an orientation trajectory (unit
+quaternions ``w, x, y, z``), the reading for every frame is computed in
+one pass as
+
+    reading = R(t)^T (a(t) / units_per_g + gravity) + bias + noise
+
+where ``a`` is the second derivative of the position and ``R`` rotates
+the device frame into the scene. ``gravity`` defaults to ``(0, 0, -1)``,
+matching the panels' convention of Z at -1g when the device is at rest.
+"""
+
+import numpy as np
+
+from motion import TrajectoryTable
+
+
+def quaternion_from_axis_angle(axis, angles):
+    """Unit quaternions (N, 4) for rotations by ``angles`` about one ``axis``."""
+    axis = np.asarray(axis, dtype=float)
+    axis = axis / np.linalg.norm(axis)
+    half = np.asarray(angles, dtype=float)[:, None] / 2
+    return np.hstack([np.cos(half), np.sin(half) * axis])
+
+
+def quaternion_multiply(p, q):
+    """Hamilton product of two (N, 4) quaternion arrays (rotation q, then p)."""
+    pw, px, py, pz = np.moveaxis(p, -1, 0)
+    qw, qx, qy, qz = np.moveaxis(q, -1, 0)
+    return np.stack([
+        pw * qw - px * qx - py * qy - pz * qz,
+        pw * qx + px * qw + py * qz - pz * qy,
+        pw * qy - px * qz + py * qw + pz * qx,
+        pw * qz + px * qy - py * qx + pz * qw,
+    ], axis=-1)
+
+
+def quaternion_to_matrix(q):
+    """Rotation matrices (N, 3, 3) for unit quaternions (N, 4)."""
+    q = np.asarray(q, dtype=float)
+    q = q / np.linalg.norm(q, axis=-1, keepdims=True)
+    w, x, y, z = np.moveaxis(q, -1, 0)
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+        np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+        np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1),
+    ], axis=-2)
+
+
+def accelerometer_readings(
+    times,
+    positions,
+    rotations=None,
+    units_per_g=1.0,
+    gravity=(0.0, 0.0, -1.0),
+    bias=(0.0, 0.0, 0.0),
+    noise=0.0,
+    seed=0,
+):
+    """
+    Device-frame readings (N, 3), in g, for sampled positions (N, 3) and
+    optional rotation matrices (N, 3, 3).
+
+    Linear acceleration is the second-order finite difference of
+    ``positions`` over ``times``; ``units_per_g`` converts it from scene
+    units per second squared. ``noise`` is the standard deviation of
+    white noise, drawn from a seeded generator so renders are repeatable.
+    """
+    acceleration = np.gradient(np.gradient(positions, times, axis=0, edge_order=2), times, axis=0, edge_order=2)
+    world = acceleration / units_per_g + np.asarray(gravity, dtype=float)
+    if rotations is None:
+        readings = world
+    else:
+        # R^T v for every frame at once
+        readings = np.einsum("nji,nj->ni", rotations, world)
+    readings = readings + np.asarray(bias, dtype=float)
+    if noise:
+        readings = readings + np.random.default_rng(seed).normal(0.0, noise, readings.shape)
+    return readings
+
+
+class IMUSimulation:
+    """
+    One timed clip: cube poses and accelerometer traces from the same frames.
+
+    ``position_fn(times)`` returns (N, 3) positions and the optional
+    ``orientation_fn(times)`` (N, 4) quaternions. Both are evaluated once,
+    over the frame times of ``table`` (a TrajectoryTable revealing one
+    reading per frame), and ``readings`` holds the matching (N, 3) trace.
+    """
+
+    def __init__(
+        self,
+        duration,
+        frame_rate,
+        position_fn,
+        orientation_fn=None,
+        units_per_g=1.0,
+        gravity=(0.0, 0.0, -1.0),
+        bias=(0.0, 0.0, 0.0),
+        noise=0.0,
+        seed=0,
+    ):
+        self.quaternions = None
+        if orientation_fn is None:
+            rotation_fn = None
+        else:
+            def rotation_fn(times):
+                self.quaternions = np.asarray(orientation_fn(times), dtype=float)
+                return quaternion_to_matrix(self.quaternions)
+
+        num_frames = int(round(duration * frame_rate)) + 1
+        self.table = TrajectoryTable(duration, frame_rate, position_fn, num_frames, rotation_fn)
+        self.readings = accelerometer_readings(
+            self.table.times,
+            self.table.positions,
+            self.table.orientations,
+            units_per_g=units_per_g,
+            gravity=gravity,
+            bias=bias,
+            noise=noise,
+            seed=seed,
+        )
+
+    @property
+    def x(self):
+        return self.readings[:, 0]
+
+    @property
+    def y(self):
+        return self.readings[:, 1]
+
+    @property
+    def z(self):
+        return self.readings[:, 2]
@@ -0,0 +1,164 @@
+"""
+Mobject lifecycle report at section boundaries.
+
+    SCENE_LIFECYCLE=1 manim -ql main.py AccelerometerFull
+    SCENE_LIFECYCLE=strict manim -ql main.py AccelerometerFull
+
+At every ``next_section`` and when the scene ends, prints the live
+mobject count, the on-screen family size, the fixed-in-frame and
+fixed-orientation registry sizes, the number of active updaters and the
+bytes held in point arrays, with the growth since the previous boundary.
+In strict mode the render fails if a mobject that was faded out (any
+removing animation) is off screen but still registered with the camera.
+"""
+
+import functools
+import gc
+import os
+import weakref
+
+import numpy as np
+from manim import Mobject
+
+
+LIFECYCLE_ENV = "SCENE_LIFECYCLE"
+
+
+def _point_bytes(mobjects):
+    """Bytes of the distinct buffers behind the mobjects' point arrays."""
+    buffers = {}
+    for mob in mobjects:
+        array = getattr(mob, "points", None)
+        if not isinstance(array, np.ndarray):
+            continue
+        # Views (e.g. StreamingTrace's used prefix) count their whole buffer once
+        while isinstance(array.base, np.ndarray):
+            array = array.base
+        buffers[id(array)] = array.nbytes
+    return sum(buffers.values())
+
+
+class LifecycleTracker:
+    def __init__(self, scene, strict=False):
+        self.scene = scene
+        self.strict = strict
+        self.section = "default"
+        self.snapshots = []
+        self.faded = weakref.WeakSet()  # must not keep the mobjects alive itself
+
+    # === MEASURING ===
+
+    def _registries(self):
+        camera = self.scene.renderer.camera
+        return (
+            getattr(camera, "fixed_in_frame_mobjects", set()),
+            getattr(camera, "fixed_orientation_mobjects", {}),
+        )
+
+    def snapshot(self):
+        gc.collect()
+        live = [obj for obj in gc.get_objects() if isinstance(obj, Mobject)]
+        on_screen = self.scene.get_mobject_family_members()
+        fixed_in_frame, fixed_orientation = self._registries()
+        updaters = len(self.scene.updaters) + sum(
+            len(mob.updaters) for mob in on_screen if not mob.updating_suspended
+        )
+        return {
+            "section": self.section,
+            "live_mobjects": len(live),
+            "on_screen": len(on_screen),
+            "fixed_in_frame": len(fixed_in_frame),
+            "fixed_orientation": len(fixed_orientation),
+            "updaters": updaters,
+            "point_bytes": _point_bytes(live),
+        }
+
+    def leaked(self):
+        """Faded-out mobjects that are off screen but still registered."""
+        on_screen = set(map(id, self.scene.get_mobject_family_members()))
+        fixed_in_frame, fixed_orientation = self._registries()
+        leaks = []
+        for mob in list(self.faded):
+            members = mob.get_family()
+            if any(id(member) in on_screen for member in members):
+                continue  # brought back since it was faded out
+            if any(member in fixed_in_frame or member in fixed_orientation for member in members):
+                leaks.append(mob)
+        return leaks
+
+    # === REPORT ===
+
+    def report(self, next_section=None):
+        current = self.snapshot()
+        previous = self.snapshots[-1] if self.snapshots else None
+        self.snapshots.append(current)
+
+        def grown(key):
+            if previous is None:
+                return ""
+            return f" ({current[key] - previous[key]:+d})"
+
+        boundary = f"{self.section} -> {next_section}" if next_section else f"{self.section} (end)"
+        print(
+            f"[lifecycle] {boundary}: "
+            f"{current['live_mobjects']} live mobjects{grown('live_mobjects')}, "
+            f"{current['on_screen']} on screen, "
+            f"fixed-in-frame {current['fixed_in_frame']}{grown('fixed_in_frame')}, "
+            f"fixed-orientation {current['fixed_orientation']}{grown('fixed_orientation')}, "
+            f"{current['updaters']} updaters{grown('updaters')}, "
+            f"{current['point_bytes'] / 1e6:.2f} MB of points"
+        )
+
+        leaks = self.leaked()
+        if leaks:
+            names = ", ".join(sorted(type(mob).__name__ for mob in leaks))
+            message = f"{len(leaks)} faded-out mobject(s) still registered with the camera in '{self.section}': {names}"
+            if self.strict:
+                raise RuntimeError(message)
+            print(f"[lifecycle] warning: {message}")
+        return current
+
+    # === WRAPPING ===
+
+    def attach(self):
+        scene = self.scene
+        play = scene.play
+
+        @functools.wraps(play)
+        def tracked_play(*args, **kwargs):
+            result = play(*args, **kwargs)
+            for animation in args:
+                if getattr(animation, "remover", False) and getattr(animation, "mobject", None) is not None:
+                    self.faded.add(animation.mobject)
+            return result
+
+        scene.play = tracked_play
+
+        next_section = scene.next_section
+
+        @functools.wraps(next_section)
+        def tracked_next_section(name="unnamed", *args, **kwargs):
+            self.report(name)
+            self.section = name
+            return next_section(name, *args, **kwargs)
+
+        scene.next_section = tracked_next_section
+
+        tear_down = scene.tear_down
+
+        @functools.wraps(tear_down)
+        def tear_down_and_report(*args, **kwargs):
+            result = tear_down(*args, **kwargs)
+            self.report()
+            return result
+
+        scene.tear_down = tear_down_and_report
+        return self
+
+
+def attach_lifecycle(scene):
+    """Report (or, with SCENE_LIFECYCLE=strict, enforce) cleanup per section; otherwise a no-op."""
+    mode = os.environ.get(LIFECYCLE_ENV)
+    if not mode:
+        return None
+    return LifecycleTracker(scene, strict=mode.lower() == "strict").attach()
@@ -0,0 +1,357 @@
+"""
+Real-time accelerometer view fed by a local IMU stream.
+
+    python live_mode.py serve --mjpeg 8080              # view at http://localhost:8080/
+    python live_mode.py serve --output live.mp4 --stdin
+    python live_mode.py replay capture.csv             # stand-in device
+
+``serve`` listens for UDP datagrams of little-endian float32 ``t,x,y,z``
+rows (the IMULog layout), or reads ``t,x,y,z`` text lines from stdin. It
+renders the AccelerometerFull cube and X/Y/Z panels at a fixed frame
+rate with no window. Frames go to an MJPEG HTTP stream or a video file.
+
+Ingestion runs on the asyncio loop and rendering runs on one worker
+thread. A frame that finishes late makes the loop skip the ticks it
+missed instead of queueing them, so the view never falls behind the
+stream. Latency is measured from the arrival of the newest sample in a
+frame to that frame reaching the sink.
+"""
+
+import argparse
+import asyncio
+import io
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from scene_loader import QUALITIES
+
+
+DEFAULT_PORT = 9870
+MAX_ROWS_PER_PACKET = 1024  # 16 KiB, well under the UDP limit
+
+
+class SampleInbox:
+    """Rows received since the last frame; written by the loop, drained by the renderer."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.chunks = []
+        self.latest_arrival = None
+
+    def push(self, rows):
+        arrival = time.perf_counter()
+        with self.lock:
+            self.chunks.append(rows)
+            self.latest_arrival = arrival
+
+    def drain(self):
+        with self.lock:
+            chunks, self.chunks = self.chunks, []
+            arrival, self.latest_arrival = self.latest_arrival, None
+        if not chunks:
+            return np.empty((0, 4)), None
+        return np.concatenate(chunks).astype(float), arrival
+
+
+class _UDPReceiver(asyncio.DatagramProtocol):
+    def __init__(self, inbox):
+        self.inbox = inbox
+
+    def datagram_received(self, data, addr):
+        if len(data) % 16:
+            return  # not whole float32 t,x,y,z rows
+        self.inbox.push(np.frombuffer(data, dtype="<f4").reshape(-1, 4))
+
+
+async def _read_stdin(inbox):
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    while line := await reader.readline():
+        try:
+            row = [float(value) for value in line.decode().split(",")[:4]]
+        except ValueError:
+            continue  # header or garbage
+        if len(row) == 4:
+            inbox.push(np.array([row]))
+
+
+class LiveView:
+    """The AccelerometerFull device and panels, drawn by a bare camera."""
+
+    def __init__(self, window=5.0, sample_rate=1000, gain=0.6, smoothing=0.25):
+        from manim import BLACK, DEGREES
+        from frozen_layer import FrozenLayerCamera
+        from main import PALETTE, static_elements
+        from motion import RigidMotion
+        from strip_chart import StripChart
+
+        self.camera = FrozenLayerCamera()
+        self.camera.set_phi(65 * DEGREES)
+        self.camera.set_theta(-45 * DEGREES)
+        self.camera.background_color = BLACK
+        self.camera.reset()
+
+        title, accel_group, graph_groups = static_elements()
+        self.camera.add_fixed_in_frame_mobjects(title, *graph_groups)
+        self.camera.freeze(title)
+        self.camera.freeze(*graph_groups)
+        capacity = int(sample_rate * window * 1.5) + 16
+        self.charts = [
+            StripChart(group[0], window=window, capacity=capacity, color=PALETTE[name], camera=self.camera)
+            for group, name in zip(graph_groups, "xyz")
+        ]
+        self.camera.add_fixed_in_frame_mobjects(*self.charts)
+        self.mobjects = [accel_group, title, *graph_groups, *self.charts]
+
+        self.motion = RigidMotion(accel_group, trajectory=None)
+        self.center = accel_group.get_center()
+        self.offset = np.zeros(3)
+        self.gain = gain
+        self.smoothing = smoothing
+        self.origin = None  # first sample time
+
+    def update(self, rows):
+        if len(rows):
+            if self.origin is None:
+                self.origin = rows[0, 0]
+            times = rows[:, 0] - self.origin
+            for chart, values in zip(self.charts, rows[:, 1:].T):
+                chart.push(times, values)
+            for chart in self.charts:
+                chart.scroll_to(times[-1])
+            # Displacement follows acceleration minus gravity, smoothed
+            target = self.gain * (rows[-1, 1:] + np.array([0.0, 0.0, 1.0]))
+            self.offset += self.smoothing * (target - self.offset)
+            self.motion.set_pose(self.center + self.offset)
+
+    def render(self, rows):
+        self.update(rows)
+        self.camera.reset()
+        self.camera.capture_mobjects(self.mobjects)
+        return self.camera.pixel_array
+
+
+class MJPEGSink:
+    """Local HTTP multipart JPEG stream; slow clients only ever get the newest frame."""
+
+    def __init__(self, port, host="127.0.0.1", jpeg_quality=80):
+        self.host = host
+        self.port = port
+        self.jpeg_quality = jpeg_quality
+        self.latest = None
+        self.clients = set()
+        self.loop = None
+        self.server = None
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        print(f"MJPEG stream at http://{self.host}:{self.port}/")
+
+    async def _serve_client(self, reader, writer):
+        new_frame = asyncio.Event()
+        self.clients.add(new_frame)
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(
+                b"HTTP/1.0 200 OK\r\nCache-Control: no-cache\r\n"
+                b"Content-Type: multipart/x-mixed-replace; boundary=frame\r\n\r\n"
+            )
+            while True:
+                await new_frame.wait()
+                new_frame.clear()
+                jpeg = self.latest
+                writer.write(b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n" % len(jpeg))
+                writer.write(jpeg + b"\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clients.discard(new_frame)
+            writer.close()
+
+    def _publish(self, jpeg):
+        self.latest = jpeg
+        for new_frame in self.clients:
+            new_frame.set()
+
+    def write(self, pixels, tick):
+        # Runs on the render thread
+        from PIL import Image
+
+        buffer = io.BytesIO()
+        Image.fromarray(pixels[:, :, :3]).save(buffer, "JPEG", quality=self.jpeg_quality)
+        self.loop.call_soon_threadsafe(self._publish, buffer.getvalue())
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+
+
+class VideoFileSink:
+    """Encodes to a file; dropped ticks leave gaps in the timestamps, so playback keeps wall time."""
+
+    def __init__(self, path, frame_rate):
+        self.path = path
+        self.frame_rate = frame_rate
+        self.container = None
+        self.stream = None
+
+    async def start(self):
+        pass
+
+    def write(self, pixels, tick):
+        import av
+
+        if self.container is None:
+            self.container = av.open(str(self.path), mode="w")
+            self.stream = self.container.add_stream("libx264", rate=self.frame_rate, options={"tune": "zerolatency"})
+            self.stream.height, self.stream.width = pixels.shape[:2]
+            self.stream.pix_fmt = "yuv420p"
+        frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+        frame.pts = tick
+        for packet in self.stream.encode(frame):
+            self.container.mux(packet)
+
+    def close(self):
+        if self.container is not None:
+            for packet in self.stream.encode():
+                self.container.mux(packet)
+            self.container.close()
+            print(f"Video written to {self.path}")
+
+
+class LiveStats:
+    def __init__(self):
+        self.frames = 0
+        self.dropped = 0
+        self.latencies = []
+        self.started = time.perf_counter()
+
+    def report(self, final=False):
+        elapsed = time.perf_counter() - self.started
+        latencies = np.asarray(self.latencies) * 1000
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0.0, 0.0)
+        print(
+            f"{'total' if final else 'live'}: {self.frames / elapsed:5.1f} fps, {self.dropped} dropped,"
+            f" latency p50 {p50:5.1f} ms p99 {p99:5.1f} ms"
+        )
+        if not final:
+            self.latencies.clear()
+
+
+async def run_live(view, sink, inbox, frame_rate, use_stdin=False, port=DEFAULT_PORT, duration=None):
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _UDPReceiver(inbox), local_addr=("127.0.0.1", port),
+    )
+    stdin_task = asyncio.create_task(_read_stdin(inbox)) if use_stdin else None
+    await sink.start()
+    print(f"Listening for IMU rows on udp://127.0.0.1:{port}")
+
+    # One thread owns every manim object
+    renderer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="live-render")
+    stats = LiveStats()
+    period = 1 / frame_rate
+    next_tick = loop.time()
+    next_report = next_tick + 5
+    end = next_tick + duration if duration else None
+    tick = 0
+
+    def render_and_write(rows, tick):
+        sink.write(view.render(rows), tick)
+
+    try:
+        while end is None or loop.time() < end:
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            rows, arrival = inbox.drain()
+            await loop.run_in_executor(renderer, render_and_write, rows, tick)
+            if arrival is not None:
+                stats.latencies.append(time.perf_counter() - arrival)
+            stats.frames += 1
+
+            # Skip the ticks that passed while rendering rather than catching up
+            missed = max(0, int((loop.time() - next_tick) / period))
+            stats.dropped += missed
+            tick += 1 + missed
+            next_tick += (1 + missed) * period
+            if loop.time() >= next_report:
+                stats.report()
+                next_report += 5
+    finally:
+        transport.close()
+        if stdin_task is not None:
+            stdin_task.cancel()
+        renderer.shutdown()  # waits for a frame still in flight
+        sink.close()
+        stats.report(final=True)
+
+
+def replay(path=None, port=DEFAULT_PORT, speed=1.0, sample_rate=100, duration=None):
+    """Send a recording (or a synthetic session) to the live view at its own pace."""
+    from imu_log import IMULog, synthetic_samples
+
+    log = IMULog(path) if path else None
+    duration = duration or (log.duration if log else float("inf"))
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    start = time.perf_counter()
+    sent_until = 0.0
+    print(f"Replaying {path or 'synthetic session'} to udp://127.0.0.1:{port}")
+    while sent_until < duration:
+        time.sleep(0.01)
+        now = min((time.perf_counter() - start) * speed, duration)
+        if log:
+            times, channels = log.rows_between(sent_until, now)
+        else:
+            times, channels = synthetic_samples(sent_until, now, sample_rate)
+        rows = np.column_stack([times, *channels]).astype("<f4")
+        for first in range(0, len(rows), MAX_ROWS_PER_PACKET):
+            sock.sendto(rows[first : first + MAX_ROWS_PER_PACKET].tobytes(), ("127.0.0.1", port))
+        sent_until = now
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="UDP port for IMU rows")
+    serve.add_argument("--stdin", action="store_true", help="also read t,x,y,z lines from stdin")
+    serve.add_argument("--fps", type=int, default=15)
+    serve.add_argument("--quality", choices=QUALITIES, default="low")
+    serve.add_argument("--mjpeg", type=int, metavar="PORT", help="serve frames over HTTP MJPEG")
+    serve.add_argument("--output", help="encode frames to this video file")
+    serve.add_argument("--duration", type=float, default=None, help="stop after this many seconds")
+    play = commands.add_parser("replay")
+    play.add_argument("log", nargs="?", default=None, help="CSV/.f32 capture; synthetic when omitted")
+    play.add_argument("--port", type=int, default=DEFAULT_PORT)
+    play.add_argument("--speed", type=float, default=1.0)
+    play.add_argument("--duration", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "replay":
+        replay(args.log, args.port, args.speed, duration=args.duration)
+        return 0
+
+    if (args.mjpeg is None) == (args.output is None):
+        parser.error("pick one sink: --mjpeg PORT or --output FILE")
+    from manim import config
+
+    config.quality = QUALITIES[args.quality]
+    config.frame_rate = args.fps
+    view = LiveView()
+    sink = MJPEGSink(args.mjpeg) if args.mjpeg is not None else VideoFileSink(args.output, args.fps)
+    try:
+        asyncio.run(run_live(view, sink, SampleInbox(), args.fps, args.stdin, args.port, args.duration))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+Export a scene at several resolutions and frame rates from one render.
+
+    EXPORT_RESOLUTIONS=480p15,720p30,1080p60 manim -qh main.py AccelerometerFull
+
+The scene renders once at the CLI quality. Each rendered frame is handed
+to one encoder thread per extra target. The thread downscales it with
+libswscale's area filter, drops frames down to the target rate, and
+encodes. Targets equal to the render settings are copied from manim's
+own movie. Outputs go to ``EXPORT_DIR`` (default ``exports``) as
+``<Scene>_<target>.mp4``.
+"""
+
+import functools
+import os
+import queue
+import re
+import shutil
+import threading
+from pathlib import Path
+
+from manim import config
+
+
+EXPORT_ENV = "EXPORT_RESOLUTIONS"
+EXPORT_DIR_ENV = "EXPORT_DIR"
+
+
+def parse_target(label):
+    """``"720p30"`` -> (720, 30)."""
+    match = re.fullmatch(r"(\d+)p(\d+)", label.strip())
+    if match is None:
+        raise ValueError(f"export target '{label}' is not of the form <height>p<fps>, e.g. 720p30")
+    return int(match.group(1)), int(match.group(2))
+
+
+class _TargetEncoder:
+    """Downscale + encode thread for one output; fed source frames in order."""
+
+    def __init__(self, path, width, height, frame_rate, step, queue_size=8):
+        import av
+
+        self.path = path
+        self.width = width
+        self.height = height
+        self.step = step  # keep every step-th source frame
+        self.container = av.open(str(path), mode="w")
+        self.stream = self.container.add_stream("libx264", rate=frame_rate, options={"crf": "23"})
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = "yuv420p"
+        self.frames = 0
+        self.error = None
+        # Bounded, so a slow encoder holds the renderer back instead of buffering the video
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._run, name=f"export-{path.stem}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        import av
+
+        try:
+            while True:
+                pixels = self.queue.get()
+                if pixels is None:
+                    break
+                frame = av.VideoFrame.from_ndarray(pixels, format="rgba")
+                frame = frame.reformat(
+                    width=self.width, height=self.height, format="yuv420p", interpolation="AREA",
+                )
+                frame.pts = self.frames
+                self.frames += 1
+                for packet in self.stream.encode(frame):
+                    self.container.mux(packet)
+            for packet in self.stream.encode():
+                self.container.mux(packet)
+        except Exception as error:  # re-raised on the render thread by close()
+            self.error = error
+            while self.queue.get() is not None:
+                pass
+        finally:
+            self.container.close()
+
+    def put(self, pixels):
+        self.queue.put(pixels)
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+
+class MultiExporter:
+    def __init__(self, scene, targets, out_dir):
+        self.scene = scene
+        self.out_dir = Path(out_dir)
+        self.source_frame_rate = config.frame_rate
+        self.source_height = config.pixel_height
+        aspect = config.pixel_width / config.pixel_height
+        self.encoders = []
+        self.copies = []
+        self.frame_index = 0
+
+        name = type(scene).__name__
+        for label in targets:
+            height, frame_rate = parse_target(label)
+            if height > self.source_height or frame_rate > self.source_frame_rate:
+                raise ValueError(
+                    f"export target {label} exceeds the render ({self.source_height}p"
+                    f"{self.source_frame_rate:g}); render with a higher -q flag"
+                )
+            step = self.source_frame_rate / frame_rate
+            if step != int(step):
+                raise ValueError(
+                    f"export frame rate {frame_rate} does not divide the render rate {self.source_frame_rate:g}"
+                )
+            path = self.out_dir / f"{name}_{label.strip()}.mp4"
+            if height == self.source_height and step == 1:
+                self.copies.append(path)
+                continue
+            width = int(round(height * aspect / 2)) * 2  # x264 needs even sizes
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            self.encoders.append(_TargetEncoder(path, width, height, frame_rate, int(step)))
+
+    def feed(self, frame, num_frames):
+        for _ in range(num_frames):
+            for encoder in self.encoders:
+                if self.frame_index % encoder.step == 0:
+                    encoder.put(frame)
+            self.frame_index += 1
+
+    def close(self):
+        for encoder in self.encoders:
+            encoder.close()
+            print(f"Exported {encoder.frames} frames to {encoder.path}")
+
+    def copy_full_resolution(self, movie_path):
+        for path in self.copies:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(movie_path, path)
+            print(f"Exported {path}")
+
+    def attach(self):
+        renderer = self.scene.renderer
+        add_frame = renderer.add_frame
+
+        @functools.wraps(add_frame)
+        def add_frame_and_export(frame, num_frames=1):
+            add_frame(frame, num_frames)
+            if not renderer.skip_animations:
+                self.feed(frame, num_frames)
+
+        renderer.add_frame = add_frame_and_export
+
+        file_writer = renderer.file_writer
+        finish = file_writer.finish
+
+        @functools.wraps(finish)
+        def finish_and_export(*args, **kwargs):
+            self.close()
+            result = finish(*args, **kwargs)
+            self.copy_full_resolution(file_writer.movie_file_path)
+            return result
+
+        file_writer.finish = finish_and_export
+        return self
+
+
+def attach_multi_export(scene):
+    """Export EXPORT_RESOLUTIONS targets alongside the render; otherwise a no-op."""
+    targets = os.environ.get(EXPORT_ENV)
+    if not targets:
+        return None
+    # Every frame has to be rendered; a reused partial movie would skip it
+    disable_caching = config.disable_caching
+    config.disable_caching = True
+    tear_down = scene.tear_down
+
+    @functools.wraps(tear_down)
+    def tear_down_and_restore(*args, **kwargs):
+        # Later scenes in the same process get the caching they asked for
+        config.disable_caching = disable_caching
+        return tear_down(*args, **kwargs)
+
+    scene.tear_down = tear_down_and_restore
+    out_dir = os.environ.get(EXPORT_DIR_ENV) or "exports"
+    return MultiExporter(scene, targets.split(","), out_dir).attach()
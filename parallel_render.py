@@ -0,0 +1,120 @@
+"""
+Render the sections of a scene in parallel and stitch them in order.
+
+Every worker runs the whole ``construct`` but only renders frames for one
+section; the others are fast-forwarded with ``skip_animations``, so each
+section starts from exactly the state a serial render would reach.
+
+    python parallel_render.py main.py AccelerometerFull -o accelerometer.mp4
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+SECTION_ENV = "RENDER_SECTION"
+
+ACCELEROMETER_SECTIONS = ["intro", "x_demo", "y_demo", "z_demo", "summary"]
+
+
+def section_skipped(name):
+    """True when a parallel worker was asked to render a different section."""
+    only = os.environ.get(SECTION_ENV)
+    return bool(only) and only != name
+
+
+def _render_section(scene_file, scene_name, section, media_dir, manim_args):
+    env = dict(os.environ, **{SECTION_ENV: section})
+    command = [
+        sys.executable, "-m", "manim", "render",
+        "--save_sections",
+        "--media_dir", str(media_dir),
+        *manim_args,
+        str(scene_file), scene_name,
+    ]
+    start = time.perf_counter()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+
+    for index_file in Path(media_dir).rglob(f"sections/{scene_name}.json"):
+        for entry in json.loads(index_file.read_text()):
+            if entry["name"] == section:
+                return index_file.parent / entry["video"], elapsed
+    raise RuntimeError(f"worker for section '{section}' produced no section video")
+
+
+def concat_videos(paths, output):
+    """Losslessly join videos with identical encoding settings, in order."""
+    import av
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as manifest:
+        for path in paths:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            manifest.write(f"file '{escaped}'\n")
+
+    source = av.open(manifest.name, format="concat", options={"safe": "0"})
+    output_container = av.open(str(output), mode="w")
+    try:
+        source_stream = source.streams.video[0]
+        output_stream = output_container.add_stream_from_template(template=source_stream)
+        for packet in source.demux(source_stream):
+            # Flush packets carry no timestamps; the concat demuxer already
+            # offsets dts (and pts, which differs with B-frames) across files
+            if packet.dts is None:
+                continue
+            packet.stream = output_stream
+            output_container.mux(packet)
+    finally:
+        source.close()
+        output_container.close()
+        os.unlink(manifest.name)
+
+
+def render_parallel(scene_file, scene_name, sections, output, jobs=None, manim_args=()):
+    jobs = jobs or min(len(sections), os.cpu_count() or 1)
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory(prefix="sections-") as work_dir:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(
+                    _render_section, scene_file, scene_name, section,
+                    Path(work_dir) / f"{index:02d}_{section}", list(manim_args),
+                )
+                for index, section in enumerate(sections)
+            ]
+            results = [future.result() for future in futures]
+
+        for section, (_, elapsed) in zip(sections, results):
+            print(f"{section:>12}: {elapsed:6.1f} s")
+        concat_videos([path for path, _ in results], output)
+
+    print(f"{'total':>12}: {time.perf_counter() - start:6.1f} s with {jobs} workers -> {output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-o", "--output", default=None)
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument(
+        "--sections", default=",".join(ACCELEROMETER_SECTIONS),
+        help="comma-separated section names, in playback order",
+    )
+    args, manim_args = parser.parse_known_args(argv)
+    output = args.output or f"{args.scene_name}.mp4"
+    render_parallel(
+        args.scene_file, args.scene_name, args.sections.split(","),
+        output, args.jobs, manim_args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Content-addressed cache of partial movies for updater-driven scenes.
+
+manim's own play hash serializes every mobject and closure to JSON, which
+is slow and changes from run to run once updaters close over trackers,
+profilers or growing buffers. ``PlayCache`` replaces it, for the scenes
+that attach it, with a digest of what actually determines the pixels:
+
+- the render config and the camera's orientation, background and light,
+- each animation's type and public attributes: timing, rate function,
+  parameters such as shift, angle or path arc, and its mobjects (which
+  covers ValueTracker start and end values),
+- the points, colors and widths of everything on screen,
+- every updater's code and the arrays, trackers and numbers it closes
+  over (the plotted data).
+
+A play whose digest already has a partial movie on disk is skipped and
+the movie reused, so e.g. editing the summary text leaves the X/Y/Z demo
+movies untouched. The partial-movie directory is kept under a size cap by
+evicting the least recently used movies when the scene finishes.
+
+The cache is opt-in: without ``PLAY_CACHE_MAX_MB`` manim's own hash is
+used. A play whose state is nested deeper than ``MAX_DEPTH`` also falls
+back to manim's hash rather than risk reusing a stale movie.
+
+    PLAY_CACHE_MAX_MB=2048 manim -ql main.py AccelerometerFull
+"""
+
+import functools
+import hashlib
+import os
+from pathlib import Path
+from types import FunctionType, MethodType, ModuleType
+
+import numpy as np
+
+from manim import Mobject, Scene, config, logger
+from manim.camera.camera import Camera
+import manim.renderer.cairo_renderer as cairo_renderer
+
+
+CACHE_SIZE_ENV = "PLAY_CACHE_MAX_MB"
+
+# Closures are followed this many objects deep; a play with anything
+# further away is keyed by manim's own hash instead.
+MAX_DEPTH = 6
+
+_CONFIG_KEYS = (
+    "pixel_width", "pixel_height", "frame_rate", "frame_width", "frame_height",
+    "background_color", "background_opacity", "transparent", "movie_file_extension",
+)
+
+
+class _Digest:
+    """Incremental hash over a graph of Python objects, cycle-safe."""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        self.seen = {}
+        self.truncated = False  # something was deeper than MAX_DEPTH
+
+    def feed(self, *parts):
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode()
+            self.hash.update(len(data).to_bytes(8, "little"))
+            self.hash.update(data)
+
+    def array(self, array):
+        array = np.ascontiguousarray(array)
+        self.feed("array", array.dtype.str, array.shape, array.tobytes())
+
+    def mobject(self, mob):
+        self.feed("mobject", type(mob).__name__)
+        for member in mob.get_family():
+            self.feed(type(member).__name__, member.z_index)
+            self.array(member.points)
+            for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "rgbas"):
+                rgbas = getattr(member, attr, None)
+                if rgbas is not None:
+                    self.array(rgbas)
+            for attr in ("stroke_width", "background_stroke_width", "shade_in_3d"):
+                self.feed(attr, getattr(member, attr, None))
+            for updater in member.updaters:
+                self.value(updater, 0)
+
+    def function(self, func, depth):
+        func = _unwrap(func)
+        if isinstance(func, MethodType):
+            self.function(func.__func__, depth)
+            self.value(func.__self__, depth + 1)
+            return
+        code = getattr(func, "__code__", None)
+        if code is None:
+            # Callable object (e.g. a rate function class): hash its state
+            self.value(_public_state(func) if hasattr(func, "__dict__") else type(func).__qualname__, depth + 1)
+            return
+        self.code(code)
+        for default in func.__defaults__ or ():
+            self.value(default, depth + 1)
+        for cell in func.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:  # not assigned yet
+                contents = None
+            self.value(contents, depth + 1)
+
+    def code(self, code):
+        self.feed("code", code.co_code, code.co_names)
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                self.code(const)
+            else:
+                self.feed(repr(const))
+
+    def value(self, obj, depth):
+        if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+            self.feed(type(obj).__name__, repr(obj))
+            return
+        if isinstance(obj, np.ndarray):
+            self.array(obj)
+            return
+        if isinstance(obj, np.generic):
+            self.feed(repr(obj))
+            return
+        if isinstance(obj, (ModuleType, Scene, Camera, type)):
+            self.feed("opaque", type(obj).__qualname__)
+            return
+        if depth > MAX_DEPTH:
+            self.truncated = True
+            return
+        key = id(obj)
+        if key in self.seen:
+            self.feed("ref", self.seen[key])
+            return
+        self.seen[key] = len(self.seen)
+
+        if isinstance(obj, Mobject):
+            self.mobject(obj)
+        elif isinstance(obj, (FunctionType, MethodType, functools.partial)) or hasattr(obj, "__wrapped__"):
+            if isinstance(obj, functools.partial):
+                self.function(obj.func, depth)
+                self.value((obj.args, obj.keywords), depth + 1)
+            else:
+                self.function(obj, depth)
+        elif isinstance(obj, dict):
+            self.feed("dict", len(obj))
+            for k, v in obj.items():
+                self.value(k, depth + 1)
+                self.value(v, depth + 1)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+            self.feed(type(obj).__name__, len(items))
+            for item in items:
+                self.value(item, depth + 1)
+        elif hasattr(obj, "__dict__"):
+            self.feed("object", type(obj).__qualname__)
+            self.value(_public_state(obj), depth + 1)
+        elif callable(obj):
+            self.function(obj, depth)
+        else:
+            self.feed("opaque", type(obj).__qualname__)
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+def _public_state(obj):
+    # Underscore attributes are scratch buffers and caches (e.g. RigidMotion's
+    # np.empty scratch space), whose contents don't decide what is drawn
+    return {name: value for name, value in vars(obj).items() if not name.startswith("_")}
+
+
+def _unwrap(func):
+    """Strip wrappers such as the profiler's timed updaters."""
+    while hasattr(func, "__wrapped__"):
+        func = func.__wrapped__
+    return func
+
+
+class PlayCache:
+    def __init__(self, scene, max_bytes):
+        self.scene = scene
+        self.max_bytes = max_bytes
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, animations, mobjects):
+        """Digest of the play, or None when its state is too deep to hash in full."""
+        digest = _Digest()
+        digest.feed("config", *(repr(config[key]) for key in _CONFIG_KEYS))
+
+        camera = self.scene.renderer.camera
+        digest.feed("camera", type(camera).__name__)
+        # Scenes set these on the camera directly (clip1), not through config
+        digest.feed("background", repr(camera.background_color), repr(camera.background_opacity))
+        light_source = getattr(camera, "light_source", None)
+        if light_source is not None:
+            digest.array(light_source.get_center())
+        for name in ("phi", "theta", "gamma", "zoom", "focal_distance"):
+            getter = getattr(camera, f"get_{name}", None)
+            if getter is not None:
+                digest.feed(name, repr(float(getter())))
+        digest.array(np.asarray(camera.frame_center, dtype=float))
+        fixed = getattr(camera, "fixed_in_frame_mobjects", ())
+        digest.feed("fixed", *sorted(
+            index for index, mob in enumerate(self.scene.get_mobject_family_members()) if mob in fixed
+        ))
+
+        # Before begin(): starting/target mobjects do not exist yet, so the
+        # parameters they are built from (shift_vector, angle, path_arc, ...)
+        # have to be hashed, as manim's get_json(animations) does
+        for animation in animations:
+            digest.feed("animation", type(animation).__name__)
+            digest.value(animation, 0)
+        digest.feed("scene", len(mobjects))
+        for mob in mobjects:
+            digest.value(mob, 0)
+        if digest.truncated:
+            return None
+
+        key = digest.hexdigest()
+        self.used.add(key)
+        if self.scene.renderer.file_writer.is_already_cached(key):
+            self.hits += 1
+        else:
+            self.misses += 1
+        return key
+
+    def evict(self):
+        """Drop least recently used partial movies until under the size cap."""
+        directory = Path(self.scene.renderer.file_writer.partial_movie_directory)
+        if not directory.is_dir():
+            return 0
+        movies = [path for path in directory.iterdir() if path.is_file()]
+        for path in movies:
+            if path.stem in self.used:
+                os.utime(path)  # reused or freshly written: most recently used
+        movies.sort(key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in movies)
+        evicted = 0
+        for path in movies:
+            if total <= self.max_bytes:
+                break
+            if path.stem in self.used:
+                continue
+            total -= path.stat().st_size
+            path.unlink()
+            evicted += 1
+        return evicted
+
+    def attach(self):
+        self.scene._play_cache = self
+        tear_down = self.scene.tear_down
+
+        @functools.wraps(tear_down)
+        def tear_down_and_evict(*args, **kwargs):
+            result = tear_down(*args, **kwargs)
+            evicted = self.evict()
+            logger.info(f"Play cache: {self.hits} reused, {self.misses} rendered, {evicted} evicted")
+            return result
+
+        self.scene.tear_down = tear_down_and_evict
+        return self
+
+
+_manim_hash = cairo_renderer.get_hash_from_play_call
+
+
+def _get_hash_from_play_call(scene, camera, animations, mobjects, *args, **kwargs):
+    cache = getattr(scene, "_play_cache", None)
+    key = cache.key(animations, mobjects) if cache is not None else None
+    if key is None:
+        return _manim_hash(scene, camera, animations, mobjects, *args, **kwargs)
+    return key
+
+
+def attach_play_cache(scene, max_mb=None):
+    """
+    Key ``scene``'s partial movies by PlayCache digests, capped at
+    PLAY_CACHE_MAX_MB; otherwise (or with caching disabled) a no-op.
+    """
+    if config.disable_caching:
+        return None
+    if max_mb is None:
+        max_mb = float(os.environ.get(CACHE_SIZE_ENV) or 0)
+    if max_mb <= 0:
+        return None
+    # Scenes without a PlayCache keep manim's own hash
+    cairo_renderer.get_hash_from_play_call = _get_hash_from_play_call
+    return PlayCache(scene, int(max_mb * 1024 * 1024)).attach()
@@ -0,0 +1,117 @@
+from weakref import WeakKeyDictionary
+
+from manim import *
+import numpy as np
+
+
+# Per-Axes affine map (origin, x step, y step), keyed weakly so it dies with the Axes
+_axes_transforms = WeakKeyDictionary()
+
+
+def _axes_fingerprint(axes):
+    # The endpoints of both number lines pin down the mapping, so any
+    # shift/scale/rotate of the Axes shows up here
+    return np.concatenate([
+        axes.x_axis.points[0], axes.x_axis.points[-1],
+        axes.y_axis.points[0], axes.y_axis.points[-1],
+    ])
+
+
+def _is_linear(axes):
+    return all(isinstance(axis.scaling, LinearBase) for axis in (axes.x_axis, axes.y_axis))
+
+
+def get_axes_transform(axes):
+    """
+    Return ``(origin, x_step, y_step)`` such that
+    ``axes.c2p(x, y) == origin + x * x_step + y * y_step``.
+
+    The transform is probed from ``c2p`` once per Axes and reused until
+    the Axes is moved.
+    """
+    fingerprint = _axes_fingerprint(axes)
+    cached = _axes_transforms.get(axes)
+    if cached is not None and np.array_equal(cached[0], fingerprint):
+        return cached[1]
+
+    origin = np.array(axes.c2p(0, 0), dtype=float)
+    x_step = np.array(axes.c2p(1, 0), dtype=float) - origin
+    y_step = np.array(axes.c2p(0, 1), dtype=float) - origin
+    transform = (origin, x_step, y_step)
+    _axes_transforms[axes] = (fingerprint, transform)
+    return transform
+
+
+def coords_to_points(axes, x_values, y_values):
+    """Vectorized ``axes.c2p`` over whole arrays, returning an (N, 3) array."""
+    x_values = np.asarray(x_values, dtype=float)
+    y_values = np.asarray(y_values, dtype=float)
+    if not _is_linear(axes):
+        return np.array([axes.c2p(x, y) for x, y in zip(x_values, y_values)])
+
+    origin, x_step, y_step = get_axes_transform(axes)
+    points = np.multiply.outer(x_values, x_step)
+    points += np.multiply.outer(y_values, y_step)
+    points += origin
+    return points
+
+
+# ============================================================
+# LEVEL OF DETAIL
+# ============================================================
+
+def pixel_columns(axes):
+    """Number of output pixel columns covered by the x axis at the render resolution."""
+    return axes.x_axis.get_length() * config.pixel_width / config.frame_width
+
+
+def _min_max_halve(values, index):
+    # Keep the min and the max of every 4 samples, in time order, so
+    # narrow spikes survive while the sample count halves
+    n = len(index) // 4 * 4
+    blocks = index[:n].reshape(-1, 4)
+    block_values = values[blocks]
+    lo = block_values.argmin(axis=1)
+    hi = block_values.argmax(axis=1)
+    first = np.minimum(lo, hi)
+    second = np.where(lo == hi, 3, np.maximum(lo, hi))
+    rows = np.arange(len(blocks))
+    kept = np.stack([blocks[rows, first], blocks[rows, second]], axis=1).ravel()
+    return np.concatenate([kept, index[n:]])
+
+
+def min_max_decimate(values, max_points):
+    """Indices into ``values``, min/max-halved until at most ``max_points`` remain."""
+    values = np.asarray(values, dtype=float)
+    index = np.arange(len(values))
+    while len(index) > max(max_points, 7):
+        index = _min_max_halve(values, index)
+    return index
+
+
+class LODPyramid:
+    """
+    Min/max decimation levels of one signal.
+
+    Each level is an index array into the original samples holding about
+    half the samples of the previous one, built once up front. Picking a
+    level per frame is a log2, and cutting a level at a sample count is a
+    binary search.
+    """
+
+    def __init__(self, values, min_size=16):
+        values = np.asarray(values, dtype=float)
+        self.levels = [np.arange(len(values))]
+        while len(self.levels[-1]) > max(min_size, 7):
+            self.levels.append(_min_max_halve(values, self.levels[-1]))
+
+    def pick_level(self, visible_samples, pixels, per_pixel=2):
+        """Finest level keeping at most ``per_pixel`` points per pixel column."""
+        ratio = visible_samples / (per_pixel * max(pixels, 1.0))
+        if ratio <= 1:
+            return 0
+        return min(int(np.ceil(np.log2(ratio))), len(self.levels) - 1)
+
+    def prefix_length(self, level, count):
+        """Number of entries of ``level`` taken from the first ``count`` samples."""
+        return int(np.searchsorted(self.levels[level], count))
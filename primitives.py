@@ -0,0 +1,180 @@
+from collections import defaultdict
+from functools import lru_cache
+
+from manim import *
+import numpy as np
+
+
+def _polygon_points(corners):
+    """Bezier points of a closed straight-edged polygon, as set_points_as_corners makes them."""
+    start = np.asarray(corners, dtype=float)
+    end = np.roll(start, -1, axis=0)
+    alphas = np.linspace(0, 1, 4)[None, :, None]
+    return (start[:, None] + (end - start)[:, None] * alphas).reshape(-1, 3)
+
+
+class Mesh:
+    """
+    Geometry shared by every instance of a primitive.
+
+    ``faces`` are tuples of vertex indices, counter-clockwise seen from
+    outside so the camera's shading gets outward normals. The Bezier
+    points of all faces are built once, in mesh space; an instance is one
+    matrix product over them.
+    """
+
+    def __init__(self, vertices, faces):
+        self.vertices = np.asarray(vertices, dtype=float)
+        self.faces = [tuple(face) for face in faces]
+        blocks = [_polygon_points(self.vertices[list(face)]) for face in self.faces]
+        self.points = np.concatenate(blocks)
+        bounds = np.cumsum([0] + [len(block) for block in blocks])
+        self.slices = [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+@lru_cache(maxsize=None)
+def box_mesh(side_length=2.0):
+    # Vertex i sits at the corner whose x, y, z bits are those of i
+    corners = np.array([[(i >> axis) & 1 for axis in range(3)] for i in range(8)], dtype=float)
+    faces = [(4, 5, 7, 6), (0, 2, 3, 1), (1, 3, 7, 5), (0, 4, 6, 2), (2, 6, 7, 3), (0, 1, 5, 4)]
+    return Mesh((corners - 0.5) * side_length, faces)
+
+
+@lru_cache(maxsize=None)
+def arrow_mesh(length, thickness=0.02, height=0.3, base_radius=0.08, resolution=8):
+    """
+    Arrow along OUT from the origin: a prism shaft, a pyramid tip and caps.
+
+    Faces are ordered shaft sides, tip sides, tip base, shaft bottom.
+    """
+    n = resolution
+    angles = np.linspace(0, TAU, n, endpoint=False)
+    ring = np.column_stack([np.cos(angles), np.sin(angles), np.zeros(n)])
+    neck = length - height
+    vertices = np.concatenate([
+        ring * thickness,
+        ring * thickness + neck * OUT,
+        ring * base_radius + neck * OUT,
+        [length * OUT],
+    ])
+    bottom, top, rim, apex = 0, n, 2 * n, 3 * n
+    faces = [(bottom + i, bottom + (i + 1) % n, top + (i + 1) % n, top + i) for i in range(n)]
+    faces += [(rim + i, rim + (i + 1) % n, apex) for i in range(n)]
+    faces.append(tuple(rim + i for i in reversed(range(n))))
+    faces.append(tuple(bottom + i for i in reversed(range(n))))
+    return Mesh(vertices, faces)
+
+
+class MeshInstance(VGroup):
+    """
+    One placed copy of a shared Mesh, with one flat face per submobject.
+
+    Only the transform (``rotation`` then ``offset``) and the style belong
+    to the instance; the geometry is the mesh's.
+    """
+
+    def __init__(
+        self,
+        mesh,
+        rotation=None,
+        offset=ORIGIN,
+        color=WHITE,
+        fill_opacity=1.0,
+        stroke_color=None,
+        stroke_width=0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.mesh = mesh
+        rotation = np.identity(3) if rotation is None else np.asarray(rotation, dtype=float)
+        points = mesh.points @ rotation.T + offset
+        for part in mesh.slices:
+            face = ThreeDVMobject()
+            face.points = points[part]
+            self.add(face)
+        self.set_fill(color, opacity=fill_opacity)
+        # A hairline of the fill color hides antialiasing seams between faces
+        self.set_stroke(stroke_color or color, width=stroke_width)
+
+
+class MeshCube(MeshInstance):
+    """Drop-in for Cube: six faces of a shared box mesh."""
+
+    def __init__(self, side_length=2.0, fill_opacity=0.75, fill_color=BLUE, stroke_width=0, stroke_color=WHITE, **kwargs):
+        super().__init__(
+            box_mesh(float(side_length)),
+            color=fill_color,
+            fill_opacity=fill_opacity,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            **kwargs,
+        )
+
+
+class MeshArrow(MeshInstance):
+    """
+    Drop-in for Arrow3D with ``resolution`` sides instead of 24x24 patches.
+
+    Arrows with the same length and proportions share one mesh.
+    """
+
+    def __init__(
+        self,
+        start=LEFT,
+        end=RIGHT,
+        thickness=0.02,
+        height=0.3,
+        base_radius=0.08,
+        color=WHITE,
+        resolution=8,
+        **kwargs,
+    ):
+        start = np.asarray(start, dtype=float)
+        vect = np.asarray(end, dtype=float) - start
+        length = float(np.linalg.norm(vect))
+        mesh = arrow_mesh(round(length, 6), thickness, height, base_radius, resolution)
+        self.resolution = resolution
+        super().__init__(mesh, rotation=z_to_vector(vect), offset=start, color=color, **kwargs)
+
+    def get_start(self):
+        # Center of the bottom cap
+        return self.submobjects[-1].get_center()
+
+    def get_end(self):
+        # Apex, the third corner of the first tip face
+        return self.submobjects[self.resolution].points[8].copy()
+
+
+class DepthSortedCamera(ThreeDCamera):
+    """
+    ThreeDCamera whose back-to-front sort is a single argsort.
+
+    The stock camera calls ``get_center`` and a dot product per shaded
+    mobject from a Python sort key. Here the bounding-box centers of all
+    shaded mobjects are gathered (stacked by point count) and projected
+    in one go; the order is the same.
+    """
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        shaded = [mob for mob in mobjects if getattr(mob, "shade_in_3d", False)]
+        if not shaded:
+            return mobjects
+
+        by_size = defaultdict(list)
+        centers = np.empty((len(shaded), 3))
+        for index, mob in enumerate(shaded):
+            if hasattr(mob, "z_index_group"):
+                # Sorted by its group's center (set_shade_in_3d(z_index_as_group=True))
+                centers[index] = mob.get_z_index_reference_point()
+            else:
+                by_size[len(mob.points)].append(index)
+        for indices in by_size.values():
+            stacked = np.stack([shaded[index].points for index in indices])
+            centers[indices] = (stacked.min(axis=1) + stacked.max(axis=1)) / 2
+        depths = centers @ self.get_rotation_matrix()[2]
+        order = np.argsort(depths, kind="stable")
+
+        # Unshaded mobjects keep their order and go on top, as before
+        flat = [mob for mob in mobjects if not getattr(mob, "shade_in_3d", False)]
+        return [shaded[index] for index in order] + flat
@@ -0,0 +1,241 @@
+"""
+Opt-in per-frame profiling for scenes.
+
+    SCENE_PROFILE=profiles manim -ql main.py AccelerometerFull
+
+writes ``profiles/AccelerometerFull.profile.json`` with p50/p99 frame and
+stage costs per section, per-updater timings, one entry per play/wait and
+a ``traceEvents`` list in Chrome trace format (chrome://tracing, Perfetto
+or speedscope render it as a flame chart).
+"""
+
+import functools
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+
+PROFILE_ENV = "SCENE_PROFILE"
+
+
+def _label(func):
+    name = getattr(func, "__qualname__", None) or type(func).__name__
+    # Drop the "<locals>" noise of closures but keep the enclosing name
+    parts = [part for part in name.split(".") if part != "<locals>"]
+    return ".".join(parts[-2:])
+
+
+class _TimedUpdater:
+    """Updater wrapper that still compares equal to the function it wraps."""
+
+    def __init__(self, profiler, updater):
+        functools.update_wrapper(self, updater)
+        self.profiler = profiler
+        self.label = _label(updater)
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        try:
+            return self.__wrapped__(*args)
+        finally:
+            self.profiler.record_updater(self.label, start, time.perf_counter())
+
+    def __eq__(self, other):
+        if isinstance(other, _TimedUpdater):
+            other = other.__wrapped__
+        return self.__wrapped__ == other
+
+    def __hash__(self):
+        return hash(self.__wrapped__)
+
+
+def _percentiles(values):
+    if not values:
+        return {"p50": 0.0, "p99": 0.0, "max": 0.0}
+    values = np.asarray(values) * 1000
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max()),
+    }
+
+
+class SceneProfiler:
+    def __init__(self, scene):
+        self.scene = scene
+        self.section = "default"
+        self.origin = time.perf_counter()
+        self.trace_events = []
+        self.segments = []
+        self.frames = []
+        self.updater_calls = defaultdict(list)
+        self._frame = None
+        self._segment_depth = 0  # wait() and move_camera() go through play()
+
+    # === RECORDING ===
+
+    def _event(self, name, category, start, end, **args):
+        self.trace_events.append({
+            "name": name, "cat": category, "ph": "X", "pid": 0, "tid": 0,
+            "ts": (start - self.origin) * 1e6, "dur": (end - start) * 1e6,
+            "args": dict(section=self.section, **args),
+        })
+
+    def _open_frame(self):
+        if self._frame is None:
+            self._frame = {"section": self.section, "stages": defaultdict(float)}
+        return self._frame
+
+    def _close_frame(self):
+        if self._frame is not None:
+            self.frames.append(self._frame)
+            self._frame = None
+
+    def record_stage(self, stage, start, end):
+        self._open_frame()["stages"][stage] += end - start
+        self._event(stage, "frame", start, end)
+
+    def record_updater(self, label, start, end):
+        self.updater_calls[(self.section, label)].append(end - start)
+        self._open_frame()["stages"]["updaters"] += end - start
+        self._event(label, "updater", start, end)
+
+    # === WRAPPING ===
+
+    def _timed(self, stage, func, opens_frame=False, closes_frame=False):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if opens_frame:
+                self._close_frame()
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record_stage(stage, start, time.perf_counter())
+                if closes_frame:
+                    self._close_frame()
+
+        return wrapper
+
+    def _segment(self, kind, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if self._segment_depth:
+                return func(*args, **kwargs)
+            self.wrap_updaters()
+            first_frame = len(self.frames)
+            start = time.perf_counter()
+            self._segment_depth += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._segment_depth -= 1
+                end = time.perf_counter()
+                self._close_frame()
+                index = len(self.segments)
+                self.segments.append({
+                    "kind": kind, "index": index, "section": self.section,
+                    "start_s": start - self.origin, "duration_s": end - start,
+                    "frames": len(self.frames) - first_frame,
+                })
+                self._event(f"{kind} #{index}", "segment", start, end)
+
+        return wrapper
+
+    def wrap_updaters(self):
+        for mob in self.scene.get_mobject_family_members():
+            mob.updaters = [
+                updater if isinstance(updater, _TimedUpdater) else _TimedUpdater(self, updater)
+                for updater in mob.updaters
+            ]
+
+    def attach(self):
+        scene = self.scene
+        renderer = scene.renderer
+        scene.play = self._segment("play", scene.play)
+        scene.wait = self._segment("wait", scene.wait)
+        scene.update_to_time = self._timed("update", scene.update_to_time, opens_frame=True)
+        renderer.update_frame = self._timed("render", renderer.update_frame)
+        renderer.camera.get_mobjects_to_display = self._timed(
+            "depth_sort", renderer.camera.get_mobjects_to_display
+        )
+        renderer.file_writer.write_frame = self._timed(
+            "encode", renderer.file_writer.write_frame, closes_frame=True
+        )
+
+        next_section = scene.next_section
+
+        @functools.wraps(next_section)
+        def tracked_next_section(name="unnamed", *args, **kwargs):
+            self._close_frame()
+            self.section = name
+            return next_section(name, *args, **kwargs)
+
+        scene.next_section = tracked_next_section
+
+        tear_down = scene.tear_down
+
+        @functools.wraps(tear_down)
+        def tear_down_and_report(*args, **kwargs):
+            result = tear_down(*args, **kwargs)
+            self.write_report()
+            return result
+
+        scene.tear_down = tear_down_and_report
+        return self
+
+    # === REPORT ===
+
+    def summary(self):
+        sections = {}
+        for frame in self.frames:
+            entry = sections.setdefault(frame["section"], {"totals": [], "stages": defaultdict(list)})
+            entry["totals"].append(sum(
+                cost for stage, cost in frame["stages"].items()
+                if stage not in ("depth_sort", "updaters")  # nested in render/update
+            ))
+            for stage, cost in frame["stages"].items():
+                entry["stages"][stage].append(cost)
+
+        report = {}
+        for name, entry in sections.items():
+            report[name] = {
+                "frames": len(entry["totals"]),
+                "frame_ms": _percentiles(entry["totals"]),
+                "stages_ms": {stage: _percentiles(costs) for stage, costs in entry["stages"].items()},
+                "updaters": {},
+            }
+        for (section, label), calls in self.updater_calls.items():
+            updaters = report.setdefault(section, {"updaters": {}})["updaters"]
+            updaters[label] = {
+                "calls": len(calls),
+                "total_ms": float(np.sum(calls) * 1000),
+                "call_ms": _percentiles(calls),
+            }
+        return report
+
+    def write_report(self):
+        out_dir = Path(os.environ.get(PROFILE_ENV) or ".")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        path = out_dir / f"{type(self.scene).__name__}.profile.json"
+        self._close_frame()
+        report = {
+            "scene": type(self.scene).__name__,
+            "sections": self.summary(),
+            "segments": self.segments,
+            "traceEvents": self.trace_events,
+        }
+        path.write_text(json.dumps(report, indent=1))
+        print(f"Profile written to {path}")
+        return path
+
+
+def attach_profiler(scene):
+    """Instrument ``scene`` when SCENE_PROFILE is set; otherwise a no-op."""
+    if not os.environ.get(PROFILE_ENV):
+        return None
+    return SceneProfiler(scene).attach()
@@ -0,0 +1,274 @@
+"""
+Long-lived preview server that keeps manim imported between edits.
+
+    python render_daemon.py serve                           # start (foreground)
+    python render_daemon.py render main.py AccelerometerFull  # first frame -> previews/
+    python render_daemon.py stop
+
+A ``render`` request also subscribes the scene: whenever its file (or a
+helper module next to it) changes, the daemon drops the edited module and
+every module that imports it, directly or through other helpers, from
+``sys.modules`` and re-renders the subscribed scenes among them. The
+daemon's own modules are never dropped; manim, Cairo and Pango stay
+loaded. Rendering stops at the first frame, so a preview costs the
+scene's setup plus one frame.
+
+Requests are pickled, so only the user who started the daemon may send
+them. ``serve`` writes a random authkey to a 0600 file in
+``$XDG_RUNTIME_DIR`` (else ``~/.cache/render-daemon``), and the other
+commands read it from there.
+"""
+
+import argparse
+import ast
+import os
+import secrets
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+from scene_loader import QUALITIES, load_scene_module
+
+
+ADDRESS = ("127.0.0.1", 6155)
+POLL_INTERVAL = 0.2  # seconds between mtime checks
+# Modules the daemon itself runs on; reloading them would swap code under it
+DAEMON_MODULES = {"__main__", __name__, "render_daemon", "scene_loader"}
+
+
+def _key_path(address):
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    directory = Path(runtime_dir) if runtime_dir else Path.home() / ".cache" / "render-daemon"
+    return directory / f"render-daemon-{address[1]}.key"
+
+
+def _new_authkey(address):
+    """Fresh random authkey, readable only by this user."""
+    path = _key_path(address)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    key = secrets.token_bytes(32)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    os.replace(tmp, path)
+    return key
+
+
+def _read_authkey(address):
+    path = _key_path(address)
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        raise RuntimeError(f"no authkey at {path}; is the daemon running (render_daemon.py serve)?") from None
+
+
+def _imported_modules(module_file):
+    """Top-level names of the modules ``module_file`` imports, anywhere in its source."""
+    try:
+        tree = ast.parse(Path(module_file).read_text())
+    except (OSError, SyntaxError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+class RenderDaemon:
+    def __init__(self, preview_dir="previews", quality="low"):
+        self.preview_dir = Path(preview_dir).resolve()
+        self.quality = quality
+        self.modules = {}  # scene file -> module
+        self.subscriptions = {}  # (scene file, scene name) -> quality
+        self.mtimes = {}
+        self.lock = threading.Lock()  # manim's config is global: one render at a time
+        self.running = True
+
+    # === LOADING ===
+
+    def _load(self, scene_file):
+        module = self.modules.get(scene_file)
+        if module is not None:
+            return module
+        module = load_scene_module(scene_file)
+        self.modules[scene_file] = module
+        return module
+
+    def _invalidate(self, path):
+        """Forget ``path``'s module and its importers; returns the subscribed scenes to re-render."""
+        directory = path.parent
+        local = {}  # name -> module loaded from the watched directory
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if name not in DAEMON_MODULES and module_file and Path(module_file).resolve().parent == directory:
+                local[name] = module
+        stale = {name for name, module in local.items() if Path(module.__file__).resolve() == path}
+        # Helpers import each other (sections -> traces, motion, ...), so
+        # importers of a stale module are stale too, however indirect
+        imports = {name: _imported_modules(module.__file__) for name, module in local.items()}
+        changed = bool(stale)
+        while changed:
+            changed = False
+            for name in local:
+                if name not in stale and imports[name] & stale:
+                    stale.add(name)
+                    changed = True
+        stale_files = {Path(local[name].__file__).resolve() for name in stale}
+        for name in stale:
+            del sys.modules[name]
+        self.modules = {scene_file: module for scene_file, module in self.modules.items() if scene_file not in stale_files}
+        return [key for key in self.subscriptions if key[0] in stale_files]
+
+    # === RENDERING ===
+
+    def render_first_frame(self, scene_file, scene_name, quality=None):
+        from manim import tempconfig
+        from manim.utils.exceptions import EndSceneEarlyException
+        from PIL import Image
+
+        scene_file = Path(scene_file).resolve()
+        quality = quality or self.quality
+        options = {
+            "quality": QUALITIES[quality],
+            "media_dir": str(self.preview_dir / ".media"),
+            "write_to_movie": False,
+            "disable_caching": True,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+            "preview": False,
+        }
+        with self.lock:
+            start = time.perf_counter()
+            scene_class = getattr(self._load(scene_file), scene_name)
+            captured = []
+
+            def capture_and_stop(frame, num_frames=1):
+                captured.append(frame)
+                raise EndSceneEarlyException()
+
+            with tempconfig(options):
+                scene = scene_class()
+                scene.renderer.add_frame = capture_and_stop
+                scene.render()
+            if not captured:
+                raise RuntimeError(f"{scene_name} rendered no frames")
+
+            self.preview_dir.mkdir(parents=True, exist_ok=True)
+            path = self.preview_dir / f"{scene_name}.png"
+            Image.fromarray(captured[0]).save(path)
+            elapsed = time.perf_counter() - start
+            self.subscriptions[(scene_file, scene_name)] = quality
+            self._watch(scene_file.parent)
+
+        print(f"{scene_name}: first frame in {elapsed:.2f} s -> {path}")
+        return {"frame": str(path), "seconds": elapsed}
+
+    # === WATCHING ===
+
+    def _watch(self, directory):
+        for path in directory.glob("*.py"):
+            self.mtimes.setdefault(path.resolve(), path.stat().st_mtime)
+
+    def _poll(self):
+        while self.running:
+            time.sleep(POLL_INTERVAL)
+            stale = set()
+            for path, mtime in list(self.mtimes.items()):
+                try:
+                    current = path.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+                if current != mtime:
+                    self.mtimes[path] = current
+                    with self.lock:
+                        stale.update(self._invalidate(path))
+            for scene_file, scene_name in sorted(stale):
+                try:
+                    self.render_first_frame(scene_file, scene_name, self.subscriptions[(scene_file, scene_name)])
+                except Exception as error:
+                    print(f"{scene_name}: {type(error).__name__}: {error}")
+
+    # === SERVING ===
+
+    def handle(self, request):
+        command = request.get("command")
+        if command == "render":
+            return self.render_first_frame(request["file"], request["scene"], request.get("quality"))
+        if command == "stop":
+            self.running = False
+            return {"stopped": True}
+        raise ValueError(f"unknown command {command!r}")
+
+    def serve(self, address=ADDRESS):
+        # Pay for the imports before the first request, not during it
+        import manim  # noqa: F401
+
+        threading.Thread(target=self._poll, name="render-daemon-watch", daemon=True).start()
+        authkey = _new_authkey(address)
+        try:
+            with Listener(address, authkey=authkey) as listener:
+                print(f"Render daemon listening on {address[0]}:{address[1]}")
+                while self.running:
+                    try:
+                        connection = listener.accept()
+                    except (AuthenticationError, EOFError, OSError) as error:
+                        # Wrong or missing key: nothing was unpickled, keep serving
+                        print(f"Rejected connection: {type(error).__name__}: {error}")
+                        continue
+                    with connection:
+                        request = connection.recv()
+                        try:
+                            reply = {"ok": True, **self.handle(request)}
+                        except Exception as error:
+                            reply = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+                        connection.send(reply)
+        finally:
+            _key_path(address).unlink(missing_ok=True)
+
+
+def request(payload, address=ADDRESS):
+    with Client(address, authkey=_read_authkey(address)) as connection:
+        connection.send(payload)
+        return connection.recv()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=ADDRESS[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve")
+    serve.add_argument("--previews", default="previews")
+    serve.add_argument("--quality", choices=QUALITIES, default="low")
+    render = commands.add_parser("render")
+    render.add_argument("file")
+    render.add_argument("scene")
+    render.add_argument("--quality", choices=QUALITIES, default=None)
+    commands.add_parser("stop")
+    args = parser.parse_args(argv)
+
+    address = (ADDRESS[0], args.port)
+    if args.command == "serve":
+        RenderDaemon(args.previews, args.quality).serve(address)
+        return 0
+    if args.command == "render":
+        payload = {"command": "render", "file": str(Path(args.file).resolve()), "scene": args.scene, "quality": args.quality}
+    else:
+        payload = {"command": "stop"}
+    reply = request(payload, address)
+    if not reply["ok"]:
+        print(reply["error"])
+        return 1
+    if "frame" in reply:
+        print(f"{reply['frame']} ({reply['seconds']:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
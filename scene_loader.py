@@ -0,0 +1,32 @@
+"""
+Quality presets and scene-file loading shared by the render tools.
+
+Scene files are executed as a module named after the file, with their
+directory on ``sys.path`` so the helpers next to them import as usual.
+Nothing here imports manim; the tools pull it in when they render.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+
+# CLI --quality choice -> manim config.quality
+QUALITIES = {"low": "low_quality", "medium": "medium_quality", "high": "high_quality"}
+
+
+def load_scene_module(scene_file):
+    """Execute ``scene_file`` as a fresh module and register it under its stem."""
+    scene_file = Path(scene_file)
+    directory = str(scene_file.parent)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(scene_file.stem, scene_file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[scene_file.stem] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_scene_class(scene_file, scene_name):
+    return getattr(load_scene_module(scene_file), scene_name)
@@ -0,0 +1,337 @@
+"""
+Data-driven demo segments for AccelerometerFull.
+
+    SEGMENT_SPECS=segments.json manim -ql main.py AccelerometerFull
+
+A segment spec is a flat dict: the section name, a caption and its color,
+which axis arrow to flash, and a motion from ``MOTIONS`` with its
+parameters (see ``AXIS_DEMOS``; a JSON file holds a list of the same
+dicts). ``SectionEngine`` expands each spec into the caption, highlight
+and trace plays. The three traces, the progress tracker and the
+RigidMotion driving the device are built once and reused by every
+segment, so a longer segment list costs plays, not construction.
+"""
+
+import json
+
+from manim import *
+import numpy as np
+
+from frame_parallel import play_frame_parallel
+from imu_log import IMULog
+from imu_physics import IMUSimulation, quaternion_from_axis_angle
+from motion import RigidMotion
+from parallel_render import section_skipped
+from plotting import LODPyramid, coords_to_points, pixel_columns
+from traces import StreamingTrace
+
+
+GRAPH_SPAN = 5.0  # seconds across each graph panel
+DIRECTIONS = {"RIGHT": RIGHT, "LEFT": LEFT, "UP": UP, "DOWN": DOWN, "OUT": OUT, "IN": IN}
+
+SEGMENT_DEFAULTS = {
+    "caption": "",
+    "color": "#9ca3af",
+    "highlight": None,
+    "duration": 5.0,
+    "wait": 0.4,
+    "noise": 0.0,
+    "seed": 0,
+    "replay_log": False,  # plot ACCEL_LOG instead of the simulated reading, if given
+}
+
+AXIS_DEMOS = [
+    {
+        "name": "x_demo", "caption": "X-Axis: Slide Left ← → Right", "color": "x", "highlight": "x",
+        "motion": "slide", "direction": "RIGHT", "distance": 1.5, "frequency": 0.8, "peak_g": 1.2,
+    },
+    {
+        "name": "y_demo", "caption": "Y-Axis: Slide Up ↑ ↓ Down", "color": "y", "highlight": "y",
+        "motion": "slide", "direction": "UP", "distance": 1.5, "frequency": 0.8, "peak_g": 1.2,
+    },
+    {
+        # Rock about Y in place: gravity moves out of Z (-cos tilt) and into X (sin tilt)
+        "name": "z_demo", "caption": "Z-Axis: Tilt ↶ ↷ Gravity Shifts to X", "color": "z", "highlight": "z",
+        "motion": "tilt", "axis": "UP", "angle": 60, "frequency": 0.4,
+    },
+    {
+        # Quick there-and-back nudges along each axis in turn; the noise keeps it from looking drawn
+        "name": "summary", "caption": "Combined Motion: All Axes Respond", "color": "#a855f7",
+        "motion": "nudges", "duration": 3.6, "units_per_g": 12.0, "noise": 0.02, "seed": 23,
+        "replay_log": True, "wait": 0,
+        "nudges": [
+            # direction, distance, start s, duration s
+            ["RIGHT", 0.3, 0.0, 0.9],
+            ["LEFT", 0.3, 0.9, 0.8],
+            ["UP", 0.25, 1.7, 0.8],
+            ["OUT", 0.2, 2.5, 0.55],
+            ["IN", 0.2, 3.05, 0.55],
+        ],
+    },
+]
+
+
+# === MOTIONS ===
+# Each returns (position_fn, orientation_fn or None, units_per_g) for IMUSimulation
+
+def _vector(value):
+    if isinstance(value, str):
+        return DIRECTIONS[value.upper()]
+    return np.asarray(value, dtype=float)
+
+
+def slide(spec, center):
+    """Sinusoidal slide of ``distance`` along ``direction``, reading ``peak_g`` at the turns."""
+    direction = _vector(spec["direction"])
+    omega = 2 * PI * spec["frequency"]
+
+    def positions(t):
+        return center + np.outer(spec["distance"] * np.sin(omega * t), direction)
+
+    return positions, None, spec["distance"] * omega ** 2 / spec["peak_g"]
+
+
+def tilt(spec, center):
+    """Sinusoidal rocking by up to ``angle`` degrees about ``axis``, in place."""
+    axis = _vector(spec["axis"])
+    omega = 2 * PI * spec["frequency"]
+
+    def positions(t):
+        return np.tile(center, (len(t), 1))
+
+    def orientations(t):
+        return quaternion_from_axis_angle(axis, spec["angle"] * DEGREES * np.sin(omega * t))
+
+    return positions, orientations, 1.0
+
+
+def nudges(spec, center):
+    """Raised-cosine there-and-back displacements, one per ``nudges`` row."""
+    rows = [(_vector(direction), distance, start, duration) for direction, distance, start, duration in spec["nudges"]]
+
+    def positions(t):
+        result = np.tile(center, (len(t), 1))
+        for direction, distance, start, duration in rows:
+            phase = np.clip((t - start) / duration, 0, 1)
+            result += np.outer(distance * 0.5 * (1 - np.cos(2 * PI * phase)), direction)
+        return result
+
+    return positions, None, spec["units_per_g"]
+
+
+MOTIONS = {"slide": slide, "tilt": tilt, "nudges": nudges}
+# Keys each motion reads from its spec; SEGMENT_DEFAULTS does not cover these
+MOTION_KEYS = {
+    "slide": ("direction", "distance", "frequency", "peak_g"),
+    "tilt": ("axis", "angle", "frequency"),
+    "nudges": ("nudges", "units_per_g"),
+}
+HIGHLIGHTS = (None, "x", "y", "z")
+# Numeric spec fields by the range the motions need; the positive ones are divided by
+POSITIVE_KEYS = ("duration", "frequency", "peak_g", "units_per_g")
+NON_NEGATIVE_KEYS = ("wait", "noise")
+REAL_KEYS = ("distance", "angle")
+
+
+def _is_real(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and np.isfinite(value)
+
+
+def _check_direction(value, what):
+    if isinstance(value, str):
+        if value.upper() not in DIRECTIONS:
+            return [f"{what} {value!r} must be one of {sorted(DIRECTIONS)} or a vector"]
+        return []
+    if not isinstance(value, list) or len(value) != 3 or not all(map(_is_real, value)):
+        return [f"{what} must be a direction name or a list of 3 numbers"]
+    return []
+
+
+def _check_segment(spec):
+    """Problems with one segment spec, as messages (empty when it is valid)."""
+    problems = []
+    missing = [key for key in MOTION_KEYS[spec["motion"]] if key not in spec]
+    if missing:
+        problems.append(f"{spec['motion']} motion needs {', '.join(missing)}")
+    for key in POSITIVE_KEYS:
+        if key in spec and not (_is_real(spec[key]) and spec[key] > 0):
+            problems.append(f"{key} must be a positive number, got {spec[key]!r}")
+    for key in NON_NEGATIVE_KEYS:
+        if key in spec and not (_is_real(spec[key]) and spec[key] >= 0):
+            problems.append(f"{key} must be a non-negative number, got {spec[key]!r}")
+    for key in REAL_KEYS:
+        if key in spec and not _is_real(spec[key]):
+            problems.append(f"{key} must be a number, got {spec[key]!r}")
+    if "seed" in spec and not (isinstance(spec["seed"], int) and not isinstance(spec["seed"], bool)):
+        problems.append(f"seed must be an integer, got {spec['seed']!r}")
+    for key in ("direction", "axis"):
+        if key in spec:
+            problems += _check_direction(spec[key], key)
+    nudge_rows = spec.get("nudges", [])
+    if not isinstance(nudge_rows, list):
+        problems.append("nudges must be a list of [direction, distance, start, duration] rows")
+        nudge_rows = []
+    for row in nudge_rows:
+        if not isinstance(row, list) or len(row) != 4:
+            problems.append(f"nudge {row!r} must be [direction, distance, start, duration]")
+            continue
+        direction, distance, start, duration = row
+        problems += _check_direction(direction, "nudge direction")
+        if not (_is_real(distance) and _is_real(start) and start >= 0 and _is_real(duration) and duration > 0):
+            problems.append(f"nudge {row!r} needs a numeric distance, start >= 0 and duration > 0")
+    for key in ("caption", "color"):
+        if not isinstance(spec.get(key, ""), str):
+            problems.append(f"{key} must be a string")
+    if spec.get("highlight") not in HIGHLIGHTS:
+        problems.append(f"highlight must be one of {HIGHLIGHTS}")
+    return problems
+
+
+def load_segments(path):
+    """Segment specs from a JSON file holding a list of spec dicts."""
+    with open(path) as f:
+        specs = json.load(f)
+    if not isinstance(specs, list):
+        raise ValueError(f"{path} must hold a list of segment specs")
+    for index, spec in enumerate(specs):
+        if not isinstance(spec, dict):
+            raise ValueError(f"{path}: segment {index} must be a dict")
+        if "name" not in spec:
+            raise ValueError(f"{path}: segment {index} has no name")
+        if spec.get("motion") not in MOTIONS:
+            raise ValueError(f"{path}: segment '{spec['name']}' motion must be one of {sorted(MOTIONS)}")
+        problems = _check_segment(spec)
+        if problems:
+            raise ValueError(f"{path}: segment '{spec['name']}': {'; '.join(problems)}")
+    return specs
+
+
+class SectionEngine:
+    """
+    Plays segment specs on one scene with a single set of trace mobjects.
+
+    Per segment only the simulated readings, their LOD pyramids and the
+    caption are new; the previous segment's arrays are dropped when the
+    next one loads and its caption is unregistered after fading out.
+    """
+
+    def __init__(self, scene, title, accel_group, graph_axes, palette, center, accel_log=None):
+        self.scene = scene
+        self.title = title
+        self.accel_group = accel_group
+        self.graph_axes = graph_axes
+        self.palette = palette
+        self.center = center
+        self.accel_log = accel_log
+        self.axis_arrows = dict(zip("xyz", accel_group[1][:3]))
+        self.columns = [pixel_columns(axes) for axes in graph_axes]
+
+        # Built once, reused by every segment
+        self.progress = ValueTracker(0)
+        self.motion = RigidMotion(accel_group, None, clock=lambda: self.table.frame_index(self.progress.get_value()))
+        capacity = int(round(SEGMENT_DEFAULTS["duration"] * config.frame_rate)) + 1
+        self.lines = [StreamingTrace(capacity=capacity, color=palette[name], stroke_width=2.5) for name in "xyz"]
+        for index, line in enumerate(self.lines):
+            line.add_updater(self._trace_updater(index))
+            line.suspend_updating()
+
+        # Current segment (public, so the play cache sees which one is playing)
+        self.table = None
+        self.pyramids = None
+        self.level_points = None
+        self.current_levels = [0, 0, 0]
+        self.caption = None
+        self.outgoing = []  # faded out by the next segment's first play
+
+    def _trace_updater(self, index):
+        def update_trace(line):
+            progress = self.progress.get_value()
+            num_points = self.table.sample_counts[self.table.frame_index(progress)]
+            pyramid = self.pyramids[index]
+            level = pyramid.pick_level(num_points, progress * self.columns[index])
+            if level != self.current_levels[index]:
+                line.clear_trace()
+                self.current_levels[index] = level
+            line.show_prefix(self.level_points[index][level], pyramid.prefix_length(level, num_points))
+
+        return update_trace
+
+    def load(self, spec):
+        """Simulate ``spec`` and point the traces and motion driver at it."""
+        position_fn, orientation_fn, units_per_g = MOTIONS[spec["motion"]](spec, self.center)
+        sim = IMUSimulation(
+            spec["duration"], config.frame_rate, position_fn, orientation_fn,
+            units_per_g=units_per_g, noise=spec["noise"], seed=spec["seed"],
+        )
+        readings = sim.readings.T
+        if spec["replay_log"] and self.accel_log:
+            readings = IMULog(self.accel_log).window(0, GRAPH_SPAN, sim.table.sample_counts[-1])
+
+        self.table = sim.table
+        self.pyramids = [LODPyramid(data) for data in readings]
+        self.level_points = []
+        for axes, data, pyramid in zip(self.graph_axes, readings, self.pyramids):
+            points = coords_to_points(axes, np.linspace(0, GRAPH_SPAN, len(data)), data)
+            self.level_points.append([points[index] for index in pyramid.levels])
+        self.current_levels = [0, 0, 0]
+        self.motion.trajectory = self.table.position
+        self.motion.orientation = self.table.orientation if self.table.orientations is not None else None
+        self.progress.set_value(0)
+        for line in self.lines:
+            line.clear_trace()
+
+    def play_segment(self, spec):
+        spec = {**SEGMENT_DEFAULTS, **spec}
+        scene = self.scene
+        scene.next_section(spec["name"], skip_animations=section_skipped(spec["name"]))
+
+        if self.outgoing:
+            scene.play(*[FadeOut(mob) for mob in self.outgoing], run_time=0.3)
+            # Unregister what is not coming back, so the camera stops tracking it
+            scene.remove_fixed_in_frame_mobjects(*[mob for mob in self.outgoing if mob not in self.lines])
+
+        self.caption = Text(spec["caption"], font_size=20, color=self.palette.get(spec["color"], spec["color"]))
+        self.caption.next_to(self.title, DOWN, buff=0.15)
+        scene.add_fixed_in_frame_mobjects(self.caption)
+        scene.play(FadeIn(self.caption), run_time=0.4)
+
+        if spec["highlight"]:
+            arrow = self.axis_arrows[spec["highlight"]]
+            scene.play(arrow.animate.set_color(WHITE), run_time=0.15)
+            scene.play(arrow.animate.set_color(self.palette[spec["highlight"]]), run_time=0.15)
+
+        self.load(spec)
+        for line in self.lines:
+            line.resume_updating()
+        scene.add_fixed_in_frame_mobjects(*self.lines)
+
+        # The group stands in for its separately added parts while it moves
+        parts = list(self.accel_group.submobjects)
+        scene.remove(*parts)
+        scene.add(self.motion.attach())
+
+        # Updaters here depend only on the progress value, so the frames can be split
+        play_frame_parallel(
+            scene,
+            self.progress.animate.set_value(1.0),
+            run_time=spec["duration"],
+            rate_func=linear
+        )
+
+        self.motion.detach()
+        scene.remove(self.accel_group)
+        self.accel_group.move_to(self.center)
+        scene.add(*parts)
+
+        # Finished traces stay on screen without per-frame updates
+        for line in self.lines:
+            line.suspend_updating()
+        self.outgoing = [*self.lines, self.caption]
+        if spec["wait"]:
+            scene.wait(spec["wait"])
+
+    def fade_out_caption(self, run_time=0.3):
+        self.scene.play(FadeOut(self.caption), run_time=run_time)
+        self.scene.remove_fixed_in_frame_mobjects(self.caption)
+        self.outgoing = [mob for mob in self.outgoing if mob is not self.caption]
+        self.caption = None
@@ -0,0 +1,125 @@
+from manim import *
+import numpy as np
+
+from plotting import coords_to_points, min_max_decimate, pixel_columns
+from text_cache import cached_text
+
+
+class RingBuffer:
+    """
+    Fixed-size sample store whose latest ``size`` rows are always one
+    contiguous view.
+
+    Every row is written twice, ``capacity`` apart, so reading the most
+    recent samples never has to stitch the wrap-around back together.
+    """
+
+    def __init__(self, capacity, columns):
+        self.capacity = int(capacity)
+        self.storage = np.zeros((2 * self.capacity, columns))
+        self.head = 0  # next write position
+        self.size = 0
+
+    def extend(self, rows):
+        rows = np.asarray(rows, dtype=float)
+        if len(rows) > self.capacity:
+            rows = rows[-self.capacity :]
+        n = len(rows)
+        if n == 0:
+            return
+        index = (self.head + np.arange(n)) % self.capacity
+        self.storage[index] = rows
+        self.storage[index + self.capacity] = rows
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def latest(self):
+        """View of the stored rows, oldest first."""
+        end = self.head + self.capacity
+        return self.storage[end - self.size : end]
+
+
+class StripChart(VGroup):
+    """
+    Scrolling trace over an existing Axes whose x range is the window length.
+
+    Samples go into a RingBuffer, so memory and per-frame work depend on
+    the window, not on how long the recording is. Time tick labels are
+    only created when a new second scrolls in and dropped when it leaves;
+    in between they are just shifted.
+    """
+
+    def __init__(
+        self,
+        axes,
+        window=5.0,
+        capacity=4096,
+        color=WHITE,
+        stroke_width=2.5,
+        label_color="#718096",
+        label_size=9,
+        camera=None,
+    ):
+        self.axes = axes
+        self.window = window
+        self.buffer = RingBuffer(capacity, 2)
+        self.label_color = label_color
+        self.label_size = label_size
+        # Labels created later must be registered as fixed-in-frame too
+        self.camera = camera
+        self.trace = VMobject(color=color, stroke_width=stroke_width)
+        self.tick_labels = VGroup()
+        self._labels = {}  # second -> (Text, x coordinate it was placed at)
+        self._max_points = max(2, int(2 * pixel_columns(axes)))
+        self.now = 0.0
+        super().__init__(self.trace, self.tick_labels)
+
+    def push(self, times, values):
+        self.buffer.extend(np.column_stack([times, values]))
+        return self
+
+    def _update_trace(self, left):
+        samples = self.buffer.latest()
+        start = np.searchsorted(samples[:, 0], left)
+        visible = samples[start:]
+        if len(visible) < 2:
+            self.trace.clear_points()
+            return
+        # Keep the per-frame work bounded by the pixel width, not the sample
+        # rate; min/max blocks keep short spikes on screen while they scroll
+        visible = visible[min_max_decimate(visible[:, 1], self._max_points)]
+        points = coords_to_points(self.axes, visible[:, 0] - left, visible[:, 1])
+        self.trace.set_points_as_corners(points)
+
+    def _update_labels(self, left):
+        y_min = self.axes.y_range[0]
+        seconds = range(int(np.ceil(left)), int(np.floor(left + self.window)) + 1)
+        for second in [s for s in self._labels if s not in seconds]:
+            label, _ = self._labels.pop(second)
+            self.tick_labels.remove(label)
+            if self.camera is not None:
+                self.camera.remove_fixed_in_frame_mobjects(label)
+
+        for second in seconds:
+            x = second - left
+            if second not in self._labels:
+                # A new string every second: worth memoizing in process, not on disk
+                label = cached_text(f"{second}s", font_size=self.label_size, color=self.label_color, persist=False)
+                label.next_to(self.axes.c2p(x, y_min), DOWN, buff=0.05)
+                self.tick_labels.add(label)
+                if self.camera is not None:
+                    self.camera.add_fixed_in_frame_mobjects(label)
+                self._labels[second] = (label, x)
+            else:
+                label, placed_x = self._labels[second]
+                if x != placed_x:
+                    label.shift((self.axes.c2p(x, y_min) - self.axes.c2p(placed_x, y_min)) * RIGHT)
+                    self._labels[second] = (label, x)
+
+    def scroll_to(self, now):
+        """Show the window ending at ``now`` (seconds)."""
+        self.now = now
+        left = max(0.0, now - self.window)
+        self._update_trace(left)
+        self._update_labels(left)
+        return self
@@ -0,0 +1,121 @@
+"""
+Memoized Text construction for labels that repeat across panels and scenes.
+
+``cached_text`` lays out each distinct (string, font, size, weight, slant)
+once through Pango and hands out copies of the resulting glyph outlines;
+color is applied to the copy. Prototypes live in an in-memory LRU and the
+glyph points are also saved under ``<text_dir>/glyph_cache``, so a fresh
+process (a render worker, the preview daemon after a reload) skips
+layout and SVG parsing for labels it has drawn before. The disk cache
+keeps the ``MAX_DISK_ENTRIES`` most recently used files. Labels that
+rarely repeat, like running timestamps, should pass ``persist=False``.
+"""
+
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from manim import *
+from manim import __version__ as manim_version
+import numpy as np
+
+
+MAX_PROTOTYPES = 512
+MAX_DISK_ENTRIES = 4096
+FORMAT_VERSION = 1
+
+_prototypes = OrderedDict()
+
+
+class CachedText(VMobject):
+    """Text rebuilt from stored glyph outlines, one submobject per glyph."""
+
+    def __init__(self, text, glyph_points, font_size, **kwargs):
+        super().__init__(fill_opacity=1.0, stroke_width=0, **kwargs)
+        self.text = text
+        self.font_size = font_size
+        for points in glyph_points:
+            glyph = VMobject(fill_opacity=1.0, stroke_width=0)
+            glyph.points = np.array(points, dtype=float)
+            self.add(glyph)
+
+
+def _disk_path(key):
+    directory = Path(config.get_dir("text_dir")) / "glyph_cache"
+    digest = hashlib.sha256(repr((FORMAT_VERSION, manim_version, key)).encode()).hexdigest()
+    return directory / f"{digest[:32]}.npz"
+
+
+def _load(key):
+    path = _disk_path(key)
+    if not path.exists():
+        return None
+    with np.load(path) as stored:
+        glyph_points = [stored[f"arr_{i}"] for i in range(len(stored.files))]
+    # The mtime orders the entries for eviction
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return glyph_points
+
+
+def _save(key, glyph_points):
+    path = _disk_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+    np.savez(tmp, *glyph_points)
+    os.replace(tmp, path)
+    _evict(path.parent)
+
+
+def _evict(directory):
+    """Delete the least recently used files beyond MAX_DISK_ENTRIES."""
+    entries = []
+    for path in directory.glob("*.npz"):
+        if path.name.endswith(".tmp.npz"):
+            continue
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:  # evicted by another process
+            pass
+    if len(entries) <= MAX_DISK_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - MAX_DISK_ENTRIES]:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _prototype(key, persist=True):
+    prototype = _prototypes.get(key)
+    if prototype is not None:
+        _prototypes.move_to_end(key)
+        return prototype
+
+    text, font, font_size, weight, slant = key
+    glyph_points = _load(key) if persist else None
+    if glyph_points is None:
+        layout = Text(text, font=font, font_size=font_size, weight=weight, slant=slant)
+        glyph_points = [mob.points for mob in layout.family_members_with_points()]
+        if persist:
+            _save(key, glyph_points)
+    prototype = CachedText(text, glyph_points, font_size)
+
+    _prototypes[key] = prototype
+    if len(_prototypes) > MAX_PROTOTYPES:
+        _prototypes.popitem(last=False)
+    return prototype
+
+
+def cached_text(text, font_size=DEFAULT_FONT_SIZE, color=WHITE, weight=NORMAL, font="", slant=NORMAL, persist=True):
+    """
+    Copy of a memoized ``Text(text, ...)`` layout, colored ``color``.
+
+    With ``persist=False`` the layout is only kept in memory.
+    """
+    key = (text, font, float(font_size), weight, slant)
+    return _prototype(key, persist).copy().set_color(color)
@@ -0,0 +1,165 @@
+from manim import *
+import numpy as np
+
+
+class StreamingTrace(VMobject):
+    """
+    Graph line that grows by appending Bezier segments.
+
+    Handles are Catmull-Rom style, so each segment only depends on its
+    neighbouring anchors. Appending samples rewrites the previous tail
+    segment plus the new ones and never touches the committed history,
+    which keeps the per-frame cost proportional to the new samples.
+
+    Points live in a preallocated buffer and ``self.points`` is a view
+    onto its used prefix, so growing the trace does not copy the array.
+    """
+
+    def __init__(self, capacity=256, **kwargs):
+        super().__init__(**kwargs)
+        capacity = max(2, int(capacity))
+        self._anchors = np.zeros((capacity, 3))
+        self._curves = np.zeros((4 * (capacity - 1), 3))
+        self._num_anchors = 0
+        self._num_final = 0  # segments whose handles can no longer change
+
+    def _grow(self, needed):
+        capacity = len(self._anchors)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        anchors = np.zeros((capacity, 3))
+        anchors[: self._num_anchors] = self._anchors[: self._num_anchors]
+        curves = np.zeros((4 * (capacity - 1), 3))
+        curves[: len(self._curves)] = self._curves
+        self._anchors = anchors
+        self._curves = curves
+
+    def _write_segments(self, start, stop, last):
+        # Segment j runs from anchor j to anchor j + 1; neighbours outside
+        # [0, last] are clamped, which gives the open-curve end condition.
+        if stop <= start:
+            return
+        a = self._anchors
+        j = np.arange(start, stop)
+        prev = a[np.maximum(j - 1, 0)]
+        nxt = a[np.minimum(j + 2, last)]
+        p0 = a[j]
+        p1 = a[j + 1]
+        curves = self._curves[4 * start : 4 * stop].reshape(-1, 4, 3)
+        curves[:, 0] = p0
+        curves[:, 1] = p0 + (p1 - prev) / 6
+        curves[:, 2] = p1 - (nxt - p0) / 6
+        curves[:, 3] = p1
+
+    def _refresh_points(self):
+        num_curves = max(0, self._num_anchors - 1)
+        self.points = self._curves[: 4 * num_curves]
+
+    def extend(self, new_points):
+        """Append anchor points to the end of the trace."""
+        new_points = np.asarray(new_points, dtype=float).reshape(-1, 3)
+        if len(new_points) == 0:
+            return self
+        start = self._num_anchors
+        self._grow(start + len(new_points))
+        self._anchors[start : start + len(new_points)] = new_points
+        self._num_anchors += len(new_points)
+
+        last = self._num_anchors - 1
+        # Segments up to last - 2 have both neighbours, the final one is the
+        # provisional tail and gets rewritten by the next extend.
+        final = max(0, last - 1)
+        self._write_segments(self._num_final, last, last)
+        self._num_final = final
+        self._refresh_points()
+        return self
+
+    def truncate(self, num_anchors):
+        """Drop anchors past ``num_anchors``, keeping the earlier geometry."""
+        num_anchors = max(0, min(int(num_anchors), self._num_anchors))
+        if num_anchors == self._num_anchors:
+            return self
+        self._num_anchors = num_anchors
+        last = num_anchors - 1
+        self._num_final = min(self._num_final, max(0, last - 1))
+        # Re-clamp the new tail segment
+        self._write_segments(max(0, last - 1), max(0, last), last)
+        self._refresh_points()
+        return self
+
+    def clear_trace(self):
+        return self.truncate(0)
+
+    def get_num_anchors(self):
+        return self._num_anchors
+
+    def show_prefix(self, points, count, stride=1):
+        """
+        Show ``points[:count:stride]``, appending or truncating as needed.
+
+        ``points`` must be the same source array on every call; only the
+        anchors that differ from the current trace are processed.
+        """
+        target = len(range(0, min(count, len(points)), stride))
+        current = self._num_anchors
+        if target < current:
+            self.truncate(target)
+        elif target > current:
+            self.extend(points[current * stride : count : stride])
+        return self
+
+
+class PartialPath(VMobject):
+    """
+    Prefix of a reference path, cut by arc length.
+
+    The cumulative arc length of the reference curves is computed once.
+    Each ``set_proportion`` call binary-searches it for the cut curve,
+    rewrites only that curve in a private copy of the reference points and
+    exposes the prefix as a view, so the per-frame cost is logarithmic in
+    the path length instead of rebuilding the whole point array.
+    """
+
+    def __init__(self, reference, **kwargs):
+        super().__init__(**kwargs)
+        self._reference = np.array(reference.points, dtype=float)
+        self._buffer = self._reference.copy()
+        curves = self._reference.reshape(-1, 4, 3)
+        chord = np.linalg.norm(curves[:, 3] - curves[:, 0], axis=1)
+        polygon = np.linalg.norm(np.diff(curves, axis=1), axis=2).sum(axis=1)
+        # Exact for the straight segments of set_points_as_corners, a close
+        # estimate for curved ones
+        self._lengths = (chord + polygon) / 2
+        self._cumulative = np.concatenate([[0.0], np.cumsum(self._lengths)])
+        self._cut_curve = None  # curve whose slot in the buffer is partial
+        self.set_proportion(0)
+
+    def set_proportion(self, alpha):
+        if self._cut_curve is not None:
+            k = self._cut_curve
+            self._buffer[4 * k : 4 * k + 4] = self._reference[4 * k : 4 * k + 4]
+            self._cut_curve = None
+
+        num_curves = len(self._lengths)
+        total = self._cumulative[-1]
+        if alpha <= 0 or total == 0:
+            self.points = self._buffer[:0]
+            return self
+        if alpha >= 1:
+            self.points = self._buffer
+            return self
+
+        target = alpha * total
+        k = min(int(np.searchsorted(self._cumulative, target, side="right")) - 1, num_curves - 1)
+        residue = (target - self._cumulative[k]) / self._lengths[k] if self._lengths[k] else 0.0
+        if residue <= 0:
+            self.points = self._buffer[: 4 * k]
+            return self
+        self._buffer[4 * k : 4 * k + 4] = partial_bezier_points(
+            self._reference[4 * k : 4 * k + 4], 0, min(residue, 1.0)
+        )
+        self._cut_curve = k
+        self.points = self._buffer[: 4 * (k + 1)]
+        return self